@@ -3,9 +3,9 @@
 This module provides a collector for arXiv RSS/Atom feeds for category subscriptions.
 """
 
+from calendar import timegm
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
-from time import mktime
 from typing import Any
 
 import feedparser  # type: ignore[import-untyped]
@@ -18,6 +18,7 @@ from src.collectors.arxiv.utils import (
 )
 from src.collectors.base import BaseCollector, CollectorResult
 from src.collectors.errors import CollectorErrorClass, ErrorRecord
+from src.collectors.feed import parse_feed
 from src.collectors.state_machine import SourceState, SourceStateMachine
 from src.features.config.schemas.sources import SourceConfig
 from src.features.fetch.client import HttpFetcher
@@ -131,7 +132,11 @@ class ArxivRssCollector(BaseCollector):
 
             state_machine.to_parsing()
 
-            feed = feedparser.parse(result.body_bytes)
+            feed = parse_feed(
+                result.body_bytes,
+                result.headers,
+                sanitize=source_config.sanitize,
+            )
 
             if feed.bozo and feed.bozo_exception:
                 parse_warnings.append(f"Feed parsing warning: {feed.bozo_exception}")
@@ -334,8 +339,7 @@ class ArxivRssCollector(BaseCollector):
         # Try published_parsed first
         if entry.get("published_parsed"):
             try:
-                timestamp = mktime(entry.published_parsed)
-                dt = datetime.fromtimestamp(timestamp, tz=UTC)
+                dt = datetime.fromtimestamp(timegm(entry.published_parsed), tz=UTC)
                 return dt, DateConfidence.HIGH
             except (ValueError, OverflowError):
                 pass
@@ -343,8 +347,7 @@ class ArxivRssCollector(BaseCollector):
         # Try updated_parsed
         if entry.get("updated_parsed"):
             try:
-                timestamp = mktime(entry.updated_parsed)
-                dt = datetime.fromtimestamp(timestamp, tz=UTC)
+                dt = datetime.fromtimestamp(timegm(entry.updated_parsed), tz=UTC)
                 return dt, DateConfidence.MEDIUM
             except (ValueError, OverflowError):
                 pass
@@ -409,7 +412,7 @@ class ArxivRssCollector(BaseCollector):
         # Add categories/tags
         tags = entry.get("tags", [])
         if tags:
-            raw_data["categories"] = [t.get("term", "") for t in tags if t.get("term")]
+            raw_data["categories"] = [term for t in tags if (term := t.get("term"))]
 
         return raw_data
 
@@ -432,7 +435,7 @@ class ArxivRssCollector(BaseCollector):
         title = entry.get("title", "")
         summary = entry.get("summary", "")[:200] if entry.get("summary") else ""
         tags = entry.get("tags", [])
-        categories = ",".join(sorted(t.get("term", "") for t in tags if t.get("term")))
+        categories = ",".join(sorted(term for t in tags if (term := t.get("term"))))
 
         extra = {}
         if summary:
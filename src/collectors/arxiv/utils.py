@@ -36,6 +36,11 @@ RSS_ENTRY_ID_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Pattern for extracting the category from an arXiv RSS feed URL
+RSS_CATEGORY_URL_PATTERN = re.compile(
+    r"rss\.arxiv\.org/rss/([a-z]+(?:\.[A-Z]+)?)", re.IGNORECASE
+)
+
 
 def extract_arxiv_id(url_or_id: str) -> str | None:
     """Extract arXiv ID from a URL or ID string.
@@ -146,7 +151,7 @@ def get_arxiv_category_from_url(url: str) -> str | None:
         return None
 
     # Match rss.arxiv.org/rss/<category> pattern
-    match = re.search(r"rss\.arxiv\.org/rss/([a-z]+(?:\.[A-Z]+)?)", url, re.IGNORECASE)
+    match = RSS_CATEGORY_URL_PATTERN.search(url)
     if match:
         return match.group(1)
 
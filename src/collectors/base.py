@@ -23,6 +23,41 @@ RAW_JSON_MAX_SIZE = 100 * 1024  # 100KB
 # Truncation threshold for individual fields
 FIELD_TRUNCATION_THRESHOLD = 100
 
+# UTF-8 never needs more than 4 bytes per code point
+_UTF8_MAX_BYTES_PER_CHAR = 4
+
+# Keys dropped from raw_json before serialization
+_SENSITIVE_RAW_JSON_KEYS = frozenset(
+    {
+        "authorization",
+        "auth",
+        "token",
+        "api_key",
+        "apikey",
+        "secret",
+        "password",
+        "cookie",
+        "session",
+    }
+)
+
+
+def _fits_raw_json_limit(json_str: str) -> bool:
+    """Check whether serialized raw_json fits within RAW_JSON_MAX_SIZE bytes.
+
+    Short strings are accepted from their length alone, so the UTF-8 encode
+    is only paid for payloads near the limit.
+
+    Args:
+        json_str: Serialized raw_json.
+
+    Returns:
+        True if the UTF-8 size is within the limit.
+    """
+    if len(json_str) * _UTF8_MAX_BYTES_PER_CHAR <= RAW_JSON_MAX_SIZE:
+        return True
+    return len(json_str.encode("utf-8")) <= RAW_JSON_MAX_SIZE
+
 
 @dataclass(frozen=True)
 class CollectorResult:
@@ -211,7 +246,7 @@ class BaseCollector(ABC):
         json_str = json.dumps(sanitized, sort_keys=True, ensure_ascii=False)
 
         # Check size
-        if len(json_str.encode("utf-8")) <= RAW_JSON_MAX_SIZE:
+        if _fits_raw_json_limit(json_str):
             return json_str, False
 
         # Truncate and add marker
@@ -225,7 +260,7 @@ class BaseCollector(ABC):
         json_str = json.dumps(sanitized, sort_keys=True, ensure_ascii=False)
 
         # If still too large, truncate harder
-        while len(json_str.encode("utf-8")) > RAW_JSON_MAX_SIZE:
+        while not _fits_raw_json_limit(json_str):
             # Find largest string field and truncate it
             truncated = False
             for key, value in list(sanitized.items()):
@@ -251,22 +286,10 @@ class BaseCollector(ABC):
         Returns:
             Sanitized data dictionary.
         """
-        sensitive_keys = {
-            "authorization",
-            "auth",
-            "token",
-            "api_key",
-            "apikey",
-            "secret",
-            "password",
-            "cookie",
-            "session",
-        }
-
         return {
             key: value
             for key, value in data.items()
-            if key.lower() not in sensitive_keys
+            if key.lower() not in _SENSITIVE_RAW_JSON_KEYS
         }
 
     def sort_items_deterministically(self, items: list[Item]) -> list[Item]:
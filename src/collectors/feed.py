@@ -0,0 +1,56 @@
+"""Feed parsing shared by the feed-based collectors."""
+
+import feedparser  # type: ignore[import-untyped]
+
+
+def _declared_charset(content_type: str) -> str | None:
+    """Extract the charset parameter from a Content-Type header value.
+
+    Args:
+        content_type: Content-Type header value.
+
+    Returns:
+        Declared charset, or None if the header does not declare one.
+    """
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset":
+            return value.strip().strip("\"'") or None
+    return None
+
+
+def parse_feed(
+    body: bytes,
+    headers: dict[str, str],
+    *,
+    sanitize: bool = True,
+) -> feedparser.FeedParserDict:
+    """Parse a feed body with feedparser.
+
+    When the server declared a charset, it is handed to feedparser so the body
+    is decoded once with the authoritative encoding instead of being sniffed
+    from the XML declaration and re-decoded on a mismatch. Only the charset is
+    forwarded, under an XML media type: feeds are often served as text/html or
+    text/plain, which feedparser would otherwise flag as NonXMLContentType.
+    Well-formedness errors need no extra handling: feedparser already falls
+    back to its loose parser and keeps the entries it recovers, reporting the
+    error via bozo.
+
+    Args:
+        body: Raw response body.
+        headers: Response headers (lowercase keys).
+        sanitize: Whether to sanitize HTML and resolve relative URIs.
+
+    Returns:
+        Parsed feed.
+    """
+    charset = _declared_charset(headers.get("content-type", ""))
+    response_headers = (
+        {"content-type": f"application/xml; charset={charset}"} if charset else None
+    )
+    return feedparser.parse(
+        body,
+        response_headers=response_headers,
+        sanitize_html=sanitize,
+        resolve_relative_uris=sanitize,
+    )
@@ -49,6 +49,13 @@ logger = structlog.get_logger()
 # Regex to extract org from HuggingFace URL
 HF_ORG_PATTERN = re.compile(r"huggingface\.co/(?P<org>[^/]+)/?$")
 
+# README cleanup patterns, applied to every fetched model card
+_README_FRONTMATTER_PATTERN = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
+_README_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+_README_LINK_PATTERN = re.compile(r"\[([^\]]*)\]\([^)]+\)")
+_README_IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\([^)]+\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def extract_org(url: str) -> str | None:
     """Extract organization from a HuggingFace URL.
@@ -559,16 +566,16 @@ class HuggingFaceOrgCollector(BaseCollector):
             Extracted summary or None if no meaningful content found.
         """
         # Remove YAML frontmatter (---...---)
-        readme_text = re.sub(r"^---\n.*?\n---\n", "", readme_text, flags=re.DOTALL)
+        readme_text = _README_FRONTMATTER_PATTERN.sub("", readme_text)
 
         # Remove HTML tags entirely
-        readme_text = re.sub(r"<[^>]+>", "", readme_text)
+        readme_text = _README_HTML_TAG_PATTERN.sub("", readme_text)
 
         # Remove markdown links but keep text: [text](url) -> text
-        readme_text = re.sub(r"\[([^\]]*)\]\([^)]+\)", r"\1", readme_text)
+        readme_text = _README_LINK_PATTERN.sub(r"\1", readme_text)
 
         # Remove markdown images: ![alt](url)
-        readme_text = re.sub(r"!\[[^\]]*\]\([^)]+\)", "", readme_text)
+        readme_text = _README_IMAGE_PATTERN.sub("", readme_text)
 
         # Split into lines and filter
         lines = readme_text.split("\n")
@@ -600,7 +607,7 @@ class HuggingFaceOrgCollector(BaseCollector):
         summary = " ".join(content_lines[:10])
 
         # Clean up extra whitespace
-        summary = re.sub(r"\s+", " ", summary).strip()
+        summary = _WHITESPACE_PATTERN.sub(" ", summary).strip()
 
         if not summary:
             return None
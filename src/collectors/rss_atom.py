@@ -1,8 +1,8 @@
 """RSS/Atom feed collector."""
 
+from calendar import timegm
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
-from time import mktime
 
 import feedparser  # type: ignore[import-untyped]
 import structlog
@@ -13,6 +13,7 @@ from src.collectors.errors import (
     ErrorRecord,
     ParseError,
 )
+from src.collectors.feed import parse_feed
 from src.collectors.state_machine import SourceState, SourceStateMachine
 from src.features.config.schemas.sources import SourceConfig
 from src.features.fetch.client import HttpFetcher
@@ -62,13 +63,36 @@ class RssAtomCollector(BaseCollector):
         Returns:
             CollectorResult with items and status.
         """
-        log = logger.bind(
+        with structlog.contextvars.bound_contextvars(
             component="collector",
             run_id=self._run_id,
             source_id=source_config.id,
             method="rss_atom",
-        )
+        ):
+            return self._collect(
+                source_config, http_client, now, lookback_hours, max_items_override
+            )
 
+    def _collect(
+        self,
+        source_config: SourceConfig,
+        http_client: HttpFetcher,
+        now: datetime,
+        lookback_hours: int,
+        max_items_override: int | None,
+    ) -> CollectorResult:
+        """Fetch and parse a feed within the bound logging context.
+
+        Args:
+            source_config: Configuration for the source.
+            http_client: HTTP client for fetching.
+            now: Current timestamp for consistency.
+            lookback_hours: Number of hours to look back for items.
+            max_items_override: Optional runtime override for max_items.
+
+        Returns:
+            CollectorResult with items and status.
+        """
         state_machine = SourceStateMachine(
             source_id=source_config.id,
             run_id=self._run_id,
@@ -88,7 +112,7 @@ class RssAtomCollector(BaseCollector):
             )
 
             if result.error:
-                log.warning(
+                logger.warning(
                     "fetch_failed",
                     error_class=result.error.error_class.value
                     if hasattr(result.error, "error_class")
@@ -108,7 +132,7 @@ class RssAtomCollector(BaseCollector):
 
             # Handle 304 Not Modified
             if result.cache_hit:
-                log.info("cache_hit_no_changes")
+                logger.info("cache_hit_no_changes")
                 state_machine.to_parsing()
                 state_machine.to_done()
                 return CollectorResult(
@@ -120,18 +144,22 @@ class RssAtomCollector(BaseCollector):
             state_machine.to_parsing()
 
             # Parse the feed
-            feed = feedparser.parse(result.body_bytes)
+            feed = parse_feed(
+                result.body_bytes,
+                result.headers,
+                sanitize=source_config.sanitize,
+            )
 
             if feed.bozo and feed.bozo_exception:
                 # Feed had parsing issues but may still be usable
                 parse_warnings.append(f"Feed parsing warning: {feed.bozo_exception}")
-                log.warning(
+                logger.warning(
                     "feed_parse_warning",
                     bozo_exception=str(feed.bozo_exception),
                 )
 
             if not feed.entries:
-                log.info("empty_feed")
+                logger.info("empty_feed")
                 state_machine.to_done()
                 return CollectorResult(
                     items=[],
@@ -165,7 +193,7 @@ class RssAtomCollector(BaseCollector):
             )
             items = self.enforce_max_items(items, max_items)
 
-            log.info(
+            logger.info(
                 "collection_complete",
                 items_emitted=len(items),
                 parse_warnings_count=len(parse_warnings),
@@ -179,7 +207,7 @@ class RssAtomCollector(BaseCollector):
             )
 
         except ParseError as e:
-            log.warning("parse_error", error=str(e))
+            logger.warning("parse_error", error=str(e))
             state_machine.to_failed()
             return CollectorResult(
                 items=[],
@@ -189,7 +217,7 @@ class RssAtomCollector(BaseCollector):
             )
 
         except Exception as e:  # noqa: BLE001
-            log.warning("unexpected_error", error=str(e))
+            logger.warning("unexpected_error", error=str(e))
             state_machine.to_failed()
             return CollectorResult(
                 items=[],
@@ -302,7 +330,7 @@ class RssAtomCollector(BaseCollector):
         # Add categories/tags if available
         tags = entry.get("tags", [])
         if tags:
-            raw_data["categories"] = [t.get("term", "") for t in tags if t.get("term")]
+            raw_data["categories"] = [term for t in tags if (term := t.get("term"))]
 
         # Truncate raw_json if needed
         raw_json, was_truncated = self.truncate_raw_json(raw_data)
@@ -342,8 +370,7 @@ class RssAtomCollector(BaseCollector):
         # Try published_parsed first (most reliable)
         if entry.get("published_parsed"):
             try:
-                timestamp = mktime(entry.published_parsed)
-                dt = datetime.fromtimestamp(timestamp, tz=UTC)
+                dt = datetime.fromtimestamp(timegm(entry.published_parsed), tz=UTC)
                 return dt, DateConfidence.HIGH
             except (ValueError, OverflowError):
                 pass
@@ -351,8 +378,7 @@ class RssAtomCollector(BaseCollector):
         # Try updated_parsed
         if entry.get("updated_parsed"):
             try:
-                timestamp = mktime(entry.updated_parsed)
-                dt = datetime.fromtimestamp(timestamp, tz=UTC)
+                dt = datetime.fromtimestamp(timegm(entry.updated_parsed), tz=UTC)
                 return dt, DateConfidence.MEDIUM
             except (ValueError, OverflowError):
                 pass
@@ -1,9 +1,12 @@
 """Collector runner with parallel execution and failure isolation."""
 
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import repeat
 
 import structlog
 
@@ -21,7 +24,7 @@ from src.collectors.state_machine import SourceState
 from src.features.config.schemas.base import SourceMethod
 from src.features.config.schemas.sources import SourceConfig
 from src.features.fetch.client import HttpFetcher
-from src.features.store.models import ItemEventType, UpsertResult
+from src.features.store.models import Item, ItemEventType, UpsertResult
 from src.features.store.store import StateStore
 
 
@@ -109,6 +112,8 @@ class CollectorRunner:
         self._lookback_hours = lookback_hours
         self._max_items_per_source = max_items_per_source
         self._metrics = CollectorMetrics.get_instance()
+        self._upserted: dict[tuple[str, str], UpsertResult] = {}
+        self._upserted_lock = threading.Lock()
         self._log = logger.bind(
             component="runner",
             run_id=run_id,
@@ -146,6 +151,9 @@ class CollectorRunner:
         now = now or datetime.now(UTC)
         started_at = datetime.now(UTC)
 
+        with self._upserted_lock:
+            self._upserted = {}
+
         self._log.info(
             "runner_started",
             source_count=len(sources),
@@ -163,46 +171,9 @@ class CollectorRunner:
             skipped_count=len(sources) - len(active_sources),
         )
 
-        # Run collectors in parallel
-        source_results: dict[str, SourceRunResult] = {}
-
-        if self._max_workers <= 1:
-            # Sequential execution
-            for source in active_sources:
-                result = self._run_single_source(source, now)
-                source_results[source.id] = result
-        else:
-            # Parallel execution
-            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-                future_to_source = {
-                    executor.submit(self._run_single_source, source, now): source
-                    for source in active_sources
-                }
-
-                for future in as_completed(future_to_source):
-                    source = future_to_source[future]
-                    try:
-                        result = future.result()
-                        source_results[source.id] = result
-                    except Exception as e:  # noqa: BLE001
-                        self._log.error(
-                            "source_execution_error",
-                            source_id=source.id,
-                            error=str(e),
-                        )
-                        source_results[source.id] = SourceRunResult(
-                            source_id=source.id,
-                            method=source.method.value,
-                            result=CollectorResult(
-                                items=[],
-                                error=ErrorRecord(
-                                    error_class=CollectorErrorClass.FETCH,
-                                    message=f"Execution error: {e}",
-                                    source_id=source.id,
-                                ),
-                                state=SourceState.SOURCE_FAILED,
-                            ),
-                        )
+        # Run collectors with validators preloaded and saved in one batch
+        with self._http_client.cache_batch():
+            source_results = self._run_sources(active_sources, now)
 
         # Aggregate results
         finished_at = datetime.now(UTC)
@@ -234,6 +205,74 @@ class CollectorRunner:
             sources_failed=sources_failed,
         )
 
+    def _run_sources(
+        self,
+        sources: list[SourceConfig],
+        now: datetime,
+    ) -> dict[str, SourceRunResult]:
+        """Run collectors for the given sources, sequentially or in parallel.
+
+        Args:
+            sources: Active source configurations.
+            now: Current timestamp.
+
+        Returns:
+            Mapping of source ID to its SourceRunResult.
+        """
+        source_results: dict[str, SourceRunResult] = {}
+
+        if self._max_workers <= 1:
+            # Sequential execution
+            for source in sources:
+                result = self._run_single_source(source, now)
+                source_results[source.id] = result
+        else:
+            # Parallel execution; map yields results in input order
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                results = executor.map(
+                    self._run_single_source_isolated, sources, repeat(now)
+                )
+                for source, result in zip(sources, results, strict=True):
+                    source_results[source.id] = result
+
+        return source_results
+
+    def _run_single_source_isolated(
+        self,
+        source: SourceConfig,
+        now: datetime,
+    ) -> SourceRunResult:
+        """Run a single source, converting unexpected errors into a failed result.
+
+        Args:
+            source: Source configuration.
+            now: Current timestamp.
+
+        Returns:
+            SourceRunResult, marked SOURCE_FAILED if the collector raised.
+        """
+        try:
+            return self._run_single_source(source, now)
+        except Exception as e:  # noqa: BLE001
+            self._log.error(
+                "source_execution_error",
+                source_id=source.id,
+                error=str(e),
+            )
+            return SourceRunResult(
+                source_id=source.id,
+                method=source.method.value,
+                result=CollectorResult(
+                    items=[],
+                    error=ErrorRecord(
+                        error_class=CollectorErrorClass.FETCH,
+                        message=f"Execution error: {e}",
+                        source_id=source.id,
+                    ),
+                    state=SourceState.SOURCE_FAILED,
+                ),
+            )
+
     def _run_single_source(
         self,
         source: SourceConfig,
@@ -248,18 +287,33 @@ class CollectorRunner:
         Returns:
             SourceRunResult with items and metrics.
         """
-        start_time_ns = time.perf_counter_ns()
-
-        log = self._log.bind(
+        with structlog.contextvars.bound_contextvars(
+            run_id=self._run_id,
             source_id=source.id,
             method=source.method.value,
-        )
+        ):
+            return self._collect_source(source, now)
+
+    def _collect_source(
+        self,
+        source: SourceConfig,
+        now: datetime,
+    ) -> SourceRunResult:
+        """Collect and upsert a single source within its logging context.
+
+        Args:
+            source: Source configuration.
+            now: Current timestamp.
 
-        log.info("source_started")
+        Returns:
+            SourceRunResult with items and metrics.
+        """
+        start_time_ns = time.perf_counter_ns()
+        self._log.info("source_started")
 
         collector = self._collectors.get(source.method)
         if not collector:
-            log.warning("unsupported_method")
+            self._log.warning("unsupported_method")
             return SourceRunResult(
                 source_id=source.id,
                 method=source.method.value,
@@ -291,7 +345,7 @@ class CollectorRunner:
 
         if result.error:
             self._metrics.record_failure(source.id, result.error.error_class)
-            log.warning(
+            self._log.warning(
                 "source_failed",
                 error_class=result.error.error_class.value,
                 duration_ms=round(duration_ms, 2),
@@ -303,27 +357,18 @@ class CollectorRunner:
                 duration_ms=duration_ms,
             )
 
-        # Upsert items to store
-        upsert_results: list[UpsertResult] = []
-        items_new = 0
-        items_updated = 0
-        items_unchanged = 0
-
-        for item in result.items:
-            upsert_result = self._store.upsert_item(item)
-            upsert_results.append(upsert_result)
-
-            if upsert_result.event_type == ItemEventType.NEW:
-                items_new += 1
-            elif upsert_result.event_type == ItemEventType.UPDATED:
-                items_updated += 1
-            else:
-                items_unchanged += 1
+        # Upsert items to store in one batch; empty results (e.g. 304 Not
+        # Modified) have nothing to persist and skip the store entirely
+        upsert_results = self._upsert_items(result.items) if result.items else []
+        event_counts = Counter(r.event_type for r in upsert_results)
+        items_new = event_counts[ItemEventType.NEW]
+        items_updated = event_counts[ItemEventType.UPDATED]
+        items_unchanged = event_counts[ItemEventType.UNCHANGED]
 
         # Record item metrics
         self._metrics.record_items(source.id, source.kind.value, len(result.items))
 
-        log.info(
+        self._log.info(
             "source_complete",
             items_emitted=len(result.items),
             items_new=items_new,
@@ -345,6 +390,59 @@ class CollectorRunner:
             upsert_results=upsert_results,
         )
 
+    def _upsert_items(self, items: list[Item]) -> list[UpsertResult]:
+        """Upsert a source's items, skipping the store for exact repeats.
+
+        Feeds routinely repeat the same entry (duplicate GUIDs, or the same
+        paper listed by several sources). A repeat of a (url, content_hash)
+        pair already upserted during this run can only be UNCHANGED, so it is
+        reported from the earlier result's stored URL and timestamps instead
+        of paying another store round trip. The reported item keeps the
+        repeating source's own fields (source_id, tier, kind, raw_json).
+        The remaining items are written in a single store transaction.
+
+        Args:
+            items: Items to upsert.
+
+        Returns:
+            UpsertResults in the same order as the input items.
+        """
+        keys = [(item.url, item.content_hash) for item in items]
+        pending: list[Item] = []
+        pending_keys: set[tuple[str, str]] = set()
+
+        with self._upserted_lock:
+            for item, key in zip(items, keys, strict=True):
+                if key not in self._upserted and key not in pending_keys:
+                    pending_keys.add(key)
+                    pending.append(item)
+
+        stored = iter(self._store.upsert_items(pending))
+        upsert_results: list[UpsertResult] = []
+
+        with self._upserted_lock:
+            for item, key in zip(items, keys, strict=True):
+                if key in pending_keys:
+                    pending_keys.discard(key)
+                    upsert_result = next(stored)
+                    self._upserted[key] = upsert_result
+                else:
+                    stored_item = self._upserted[key].item
+                    upsert_result = UpsertResult(
+                        event_type=ItemEventType.UNCHANGED,
+                        affected_rows=0,
+                        item=item.model_copy(
+                            update={
+                                "url": stored_item.url,
+                                "first_seen_at": stored_item.first_seen_at,
+                                "last_seen_at": stored_item.last_seen_at,
+                            }
+                        ),
+                    )
+                upsert_results.append(upsert_result)
+
+        return upsert_results
+
     def get_supported_methods(self) -> list[SourceMethod]:
         """Get list of supported source methods.
 
@@ -105,11 +105,6 @@ class SourceStateMachine:
         self._source_id = source_id
         self._run_id = run_id
         self._state = initial_state
-        self._log = logger.bind(
-            component="collector",
-            run_id=run_id,
-            source_id=source_id,
-        )
 
     @property
     def source_id(self) -> str:
@@ -152,8 +147,11 @@ class SourceStateMachine:
                 from_state=self._state,
                 to_state=target,
             )
-            self._log.error(
+            logger.error(
                 "illegal_state_transition",
+                component="collector",
+                run_id=self._run_id,
+                source_id=self._source_id,
                 from_state=self._state.value,
                 to_state=target.value,
             )
@@ -162,8 +160,11 @@ class SourceStateMachine:
         old_state = self._state
         self._state = target
 
-        self._log.info(
+        logger.info(
             "state_transition",
+            component="collector",
+            run_id=self._run_id,
+            source_id=self._source_id,
             from_state=old_state.value,
             to_state=target.value,
         )
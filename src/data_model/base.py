@@ -1,9 +1,67 @@
 """Shared Pydantic base models."""
 
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Self
+
 from pydantic import BaseModel, ConfigDict
 
 
+def _freeze(value: Any) -> Any:
+    """Convert a dumped field value into an equivalent hashable value.
+
+    Mappings become frozensets of their items and sequences become tuples.
+    Scalars are kept as they are, so values that compare equal across types
+    (``1``, ``1.0`` and ``True``) also hash equal.
+
+    Args:
+        value: Value from ``model_dump()``.
+
+    Returns:
+        Hashable value that is equal for equal inputs.
+    """
+    if isinstance(value, Mapping):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
 class StrictBaseModel(BaseModel):
-    """Base model with strict, immutable defaults."""
+    """Base model with strict, immutable defaults.
+
+    Instances hash by content, so they can be used in sets and as dict keys
+    even when they hold list or dict fields. The hash, like any other
+    ``cached_property`` on a subclass, is computed once per instance and is
+    not carried over to copies made with ``model_copy``.
+    """
 
     model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @cached_property
+    def _content_hash(self) -> int:
+        """Hash of the frozen field values, computed on first use."""
+        return hash(_freeze(self.model_dump()))
+
+    def __hash__(self) -> int:
+        """Return the cached content hash."""
+        return self._content_hash
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the model, dropping values cached from the original's fields.
+
+        Args:
+            update: Field values to change in the copy.
+            deep: Whether to deep-copy field values.
+
+        Returns:
+            The copied model.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for name in copied.__dict__.keys() - type(self).model_fields.keys():
+            del copied.__dict__[name]
+        return copied
@@ -11,6 +11,7 @@ Provides deterministic fixtures for all supported data sources:
 
 import hashlib
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import ClassVar
@@ -21,7 +22,7 @@ import structlog
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class FixtureInfo:
     """Information about a loaded fixture.
 
@@ -175,9 +176,20 @@ class FixtureLoader:
             dir_path: Directory path.
             source_type: Type of source these fixtures represent.
         """
-        for file_path in sorted(dir_path.iterdir()):
-            if file_path.is_file() and not file_path.name.startswith("."):
-                self._load_fixture(file_path, source_type)
+        # DirEntry caches the file type from the directory read, so filtering
+        # does not stat each fixture again
+        with os.scandir(dir_path) as it:
+            entries = sorted(
+                (
+                    entry
+                    for entry in it
+                    if entry.is_file() and not entry.name.startswith(".")
+                ),
+                key=lambda entry: entry.name,
+            )
+
+        for entry in entries:
+            self._load_fixture(Path(entry.path), source_type)
 
     def _load_fixture(self, file_path: Path, source_type: str) -> None:
         """Load a single fixture file.
@@ -9,6 +9,7 @@ Provides a repeatable INT end-to-end test workflow that:
 6. Archives evidence with checksums (ARCHIVE_EVIDENCE)
 """
 
+import json
 import shutil
 import time
 import uuid
@@ -30,6 +31,7 @@ from src.e2e.validators import (
     JsonValidator,
 )
 from src.features.evidence.capture import EvidenceCapture
+from src.features.store.store import StateStore
 
 
 logger = structlog.get_logger()
@@ -38,6 +40,21 @@ logger = structlog.get_logger()
 # Feature key for evidence capture
 E2E_FEATURE_KEY = "add-int-e2e-harness"
 
+# Minimal index.html written by the simulated pipeline
+_INDEX_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>E2E Test Output</title>
+</head>
+<body>
+    <h1>E2E Test Output</h1>
+    <p>Run ID: {run_id}</p>
+    <p>Generated: {generated_at}</p>
+</body>
+</html>
+"""
+
 
 @dataclass
 class ClearDataResult:
@@ -359,10 +376,11 @@ class E2EHarness:
         # Write a sample daily.json
         # Use frozen time if available for byte-identical outputs
         now = self._now()
+        now_iso = now.isoformat()
         sample_json = {
             "run_id": self._run_id,
-            "run_date": now.strftime("%Y-%m-%d"),
-            "generated_at": now.isoformat(),
+            "run_date": now.date().isoformat(),
+            "generated_at": now_iso,
             "top5": [],
             "model_releases_by_entity": {},
             "papers": [],
@@ -370,7 +388,7 @@ class E2EHarness:
             "sources_status": [],
             "run_info": {
                 "run_id": self._run_id,
-                "started_at": now.isoformat(),
+                "started_at": now_iso,
                 "finished_at": None,
                 "success": True,
                 "error_summary": None,
@@ -379,30 +397,16 @@ class E2EHarness:
             },
         }
 
-        import json
-
         json_path = api_dir / "daily.json"
         json_path.write_text(json.dumps(sample_json, sort_keys=True, indent=2))
 
         # Write index.html
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <title>E2E Test Output</title>
-</head>
-<body>
-    <h1>E2E Test Output</h1>
-    <p>Run ID: {self._run_id}</p>
-    <p>Generated: {now.isoformat()}</p>
-</body>
-</html>
-"""
+        html_content = _INDEX_HTML_TEMPLATE.format(
+            run_id=self._run_id, generated_at=now_iso
+        )
         (self._output_dir / "index.html").write_text(html_content)
 
         # Create database with schema
-        from src.features.store.store import StateStore
-
         with StateStore(
             db_path=self._db_path,
             run_id=self._run_id,
@@ -8,6 +8,7 @@ Provides a mock HTTP client that:
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import ClassVar
 
 import structlog
 
@@ -34,7 +35,7 @@ class NetworkAccessBlockedError(Exception):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestRecord:
     """Record of an HTTP request attempt.
 
@@ -53,7 +54,7 @@ class RequestRecord:
     blocked: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MockTransportStats:
     """Statistics for mock transport usage.
 
@@ -78,6 +79,15 @@ class MockHttpClient:
     3. Record all request attempts for audit logging
     """
 
+    # Fixture file extension to Content-Type header mapping
+    CONTENT_TYPES: ClassVar[dict[str, str]] = {
+        "xml": "application/xml",
+        "json": "application/json",
+        "html": "text/html",
+        "atom": "application/atom+xml",
+        "rss": "application/rss+xml",
+    }
+
     def __init__(
         self,
         fixture_loader: FixtureLoader,
@@ -247,14 +257,7 @@ class MockHttpClient:
             Content-Type header value.
         """
         ext = fixture.path.rsplit(".", 1)[-1].lower()
-        content_types: dict[str, str] = {
-            "xml": "application/xml",
-            "json": "application/json",
-            "html": "text/html",
-            "atom": "application/atom+xml",
-            "rss": "application/rss+xml",
-        }
-        return content_types.get(ext, "application/octet-stream")
+        return self.CONTENT_TYPES.get(ext, "application/octet-stream")
 
     def get_request_log(self) -> list[dict[str, object]]:
         """Get the request log as a list of dictionaries.
@@ -28,17 +28,31 @@ class E2EState(Enum):
     FAILED = "failed"
 
 
-# Valid state transitions (from_state -> [to_states])
-_VALID_TRANSITIONS: dict[E2EState, list[E2EState]] = {
-    E2EState.PENDING: [E2EState.CLEAR_DATA, E2EState.FAILED],
-    E2EState.CLEAR_DATA: [E2EState.RUN_PIPELINE, E2EState.FAILED],
-    E2EState.RUN_PIPELINE: [E2EState.VALIDATE_DB, E2EState.FAILED],
-    E2EState.VALIDATE_DB: [E2EState.VALIDATE_JSON, E2EState.FAILED],
-    E2EState.VALIDATE_JSON: [E2EState.VALIDATE_HTML, E2EState.FAILED],
-    E2EState.VALIDATE_HTML: [E2EState.ARCHIVE_EVIDENCE, E2EState.FAILED],
-    E2EState.ARCHIVE_EVIDENCE: [E2EState.DONE, E2EState.FAILED],
-    E2EState.DONE: [],
-    E2EState.FAILED: [],
+# Valid state transitions (from_state -> {to_states})
+_VALID_TRANSITIONS: dict[E2EState, frozenset[E2EState]] = {
+    E2EState.PENDING: frozenset({E2EState.CLEAR_DATA, E2EState.FAILED}),
+    E2EState.CLEAR_DATA: frozenset({E2EState.RUN_PIPELINE, E2EState.FAILED}),
+    E2EState.RUN_PIPELINE: frozenset({E2EState.VALIDATE_DB, E2EState.FAILED}),
+    E2EState.VALIDATE_DB: frozenset({E2EState.VALIDATE_JSON, E2EState.FAILED}),
+    E2EState.VALIDATE_JSON: frozenset({E2EState.VALIDATE_HTML, E2EState.FAILED}),
+    E2EState.VALIDATE_HTML: frozenset({E2EState.ARCHIVE_EVIDENCE, E2EState.FAILED}),
+    E2EState.ARCHIVE_EVIDENCE: frozenset({E2EState.DONE, E2EState.FAILED}),
+    E2EState.DONE: frozenset(),
+    E2EState.FAILED: frozenset(),
+}
+
+# Shared fallback for states without an entry in the transition table
+_NO_TRANSITIONS: frozenset[E2EState] = frozenset()
+
+# Next step in the success path (from_state -> to_state)
+_NEXT_STATE: dict[E2EState, E2EState] = {
+    E2EState.PENDING: E2EState.CLEAR_DATA,
+    E2EState.CLEAR_DATA: E2EState.RUN_PIPELINE,
+    E2EState.RUN_PIPELINE: E2EState.VALIDATE_DB,
+    E2EState.VALIDATE_DB: E2EState.VALIDATE_JSON,
+    E2EState.VALIDATE_JSON: E2EState.VALIDATE_HTML,
+    E2EState.VALIDATE_HTML: E2EState.ARCHIVE_EVIDENCE,
+    E2EState.ARCHIVE_EVIDENCE: E2EState.DONE,
 }
 
 
@@ -110,7 +124,7 @@ class E2EStateMachine:
         Returns:
             True if transition is valid.
         """
-        return to_state in _VALID_TRANSITIONS.get(self._state, [])
+        return to_state in _VALID_TRANSITIONS.get(self._state, _NO_TRANSITIONS)
 
     def transition(self, to_state: E2EState) -> None:
         """Transition to a new state.
@@ -165,8 +179,4 @@ class E2EStateMachine:
         Returns:
             Next state in sequence, or None if terminal.
         """
-        valid = _VALID_TRANSITIONS.get(self._state, [])
-        for state in valid:
-            if state != E2EState.FAILED:
-                return state
-        return None
+        return _NEXT_STATE.get(self._state)
@@ -16,6 +16,7 @@ import json
 import re
 import sqlite3
 from abc import ABC, abstractmethod
+from contextlib import closing
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TypeVar
@@ -30,8 +31,11 @@ logger = structlog.get_logger()
 # Type variable for validator result types
 T = TypeVar("T", bound="ValidationResult")
 
+# Table names that are safe to interpolate into COUNT queries
+_TABLE_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation check.
 
@@ -46,7 +50,7 @@ class ValidationResult:
     details: dict[str, object] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseValidationResult(ValidationResult):
     """Result of database validation.
 
@@ -59,7 +63,7 @@ class DatabaseValidationResult(ValidationResult):
     table_row_counts: dict[str, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonValidationResult(ValidationResult):
     """Result of JSON validation.
 
@@ -72,7 +76,7 @@ class JsonValidationResult(ValidationResult):
     sections_present: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HtmlValidationResult(ValidationResult):
     """Result of HTML validation.
 
@@ -138,13 +142,16 @@ class BaseValidator(ABC):
     def compute_file_checksum(file_path: Path) -> str:
         """Compute SHA-256 checksum of a file.
 
+        The file is hashed in chunks, so it is never held in memory whole.
+
         Args:
             file_path: Path to file.
 
         Returns:
             Hexadecimal checksum string.
         """
-        return BaseValidator.compute_checksum(file_path.read_bytes())
+        with file_path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
     def _log_validation_start(self, target: str, path: Path) -> None:
         """Log validation start.
@@ -189,48 +196,51 @@ class DatabaseValidator(BaseValidator):
             )
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
-
-            # Check schema version
-            schema_version = self._get_schema_version(conn)
-            if schema_version != EXPECTED_SCHEMA_VERSION:
-                return DatabaseValidationResult(
-                    passed=False,
-                    message=(
-                        f"Schema version mismatch: expected {EXPECTED_SCHEMA_VERSION}, "
-                        f"got {schema_version}"
-                    ),
+            # Read-only, so validation can never create or modify the database
+            with closing(
+                sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+            ) as conn:
+                conn.row_factory = sqlite3.Row
+
+                # Check schema version
+                schema_version = self._get_schema_version(conn)
+                if schema_version != EXPECTED_SCHEMA_VERSION:
+                    return DatabaseValidationResult(
+                        passed=False,
+                        message=(
+                            "Schema version mismatch: expected "
+                            f"{EXPECTED_SCHEMA_VERSION}, got {schema_version}"
+                        ),
+                        schema_version=schema_version,
+                    )
+
+                # Check tables exist
+                table_counts = self._get_table_counts(conn)
+                missing_tables = [
+                    t for t in self.REQUIRED_TABLES if t not in table_counts
+                ]
+                if missing_tables:
+                    return DatabaseValidationResult(
+                        passed=False,
+                        message=f"Missing required tables: {missing_tables}",
+                        schema_version=schema_version,
+                        table_row_counts=table_counts,
+                    )
+
+                self._log.info(
+                    "database_validation_passed",
                     schema_version=schema_version,
+                    table_counts=table_counts,
                 )
 
-            # Check tables exist
-            table_counts = self._get_table_counts(conn)
-            missing_tables = [t for t in self.REQUIRED_TABLES if t not in table_counts]
-            if missing_tables:
                 return DatabaseValidationResult(
-                    passed=False,
-                    message=f"Missing required tables: {missing_tables}",
+                    passed=True,
+                    message="Database validation passed",
                     schema_version=schema_version,
                     table_row_counts=table_counts,
+                    details={"db_path": str(db_path)},
                 )
 
-            conn.close()
-
-            self._log.info(
-                "database_validation_passed",
-                schema_version=schema_version,
-                table_counts=table_counts,
-            )
-
-            return DatabaseValidationResult(
-                passed=True,
-                message="Database validation passed",
-                schema_version=schema_version,
-                table_row_counts=table_counts,
-                details={"db_path": str(db_path)},
-            )
-
         except sqlite3.Error as e:
             return DatabaseValidationResult(
                 passed=False,
@@ -253,27 +263,33 @@ class DatabaseValidator(BaseValidator):
     def _get_table_counts(self, conn: sqlite3.Connection) -> dict[str, int]:
         """Get row counts for all tables.
 
+        All tables are counted by a single UNION ALL statement, so SQLite
+        parses and steps one query instead of one per table.
+
         Args:
             conn: Database connection.
 
         Returns:
             Dictionary of table name to row count.
         """
-        counts: dict[str, int] = {}
         cursor = conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' "
             "AND name NOT LIKE 'sqlite_%'"
         )
-        valid_table_re = r"^[a-zA-Z_][a-zA-Z0-9_]*$"
-        for row in cursor.fetchall():
-            table_name: str = row["name"]
-            if not re.match(valid_table_re, table_name):
-                continue
-            count_cursor = conn.execute(  # nosemgrep: formatted-sql-query
-                f"SELECT COUNT(*) FROM {table_name}"  # noqa: S608
-            )
-            counts[table_name] = count_cursor.fetchone()[0]
-        return counts
+        table_names: list[str] = [
+            row["name"]
+            for row in cursor.fetchall()
+            if _TABLE_NAME_PATTERN.match(row["name"])
+        ]
+        if not table_names:
+            return {}
+
+        query = " UNION ALL ".join(
+            f"SELECT '{table_name}', COUNT(*) FROM {table_name}"  # noqa: S608
+            for table_name in table_names
+        )
+        count_cursor = conn.execute(query)  # nosemgrep: formatted-sql-query
+        return {table_name: count for table_name, count in count_cursor.fetchall()}
 
 
 class JsonValidator(BaseValidator):
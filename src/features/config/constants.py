@@ -21,7 +21,16 @@ COMPONENT_EVIDENCE = "evidence"
 # Supported URL schemes
 VALID_URL_SCHEMES = ("http://", "https://")
 
+# Patterns for config identifiers and schema versions. Passed to pydantic's
+# Field(pattern=...), which compiles each once per model and matches in Rust.
+CONFIG_ID_PATTERN = r"^[a-z0-9_-]+$"
+SCHEMA_VERSION_PATTERN = r"^\d+\.\d+$"
+
 # File type identifiers
 FILE_TYPE_SOURCES = "sources"
 FILE_TYPE_ENTITIES = "entities"
 FILE_TYPE_TOPICS = "topics"
+
+# hashlib algorithm for config and config-file checksums. Checksums are
+# recorded with each run, so changing this breaks comparison with past runs.
+CHECKSUM_ALGO = "sha256"
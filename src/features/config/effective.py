@@ -2,16 +2,38 @@
 
 import hashlib
 import json
-from typing import Annotated
+from functools import cached_property
+from typing import Annotated, Any
 
 from pydantic import Field
 
 from src.data_model import StrictBaseModel
+from src.features.config.constants import CHECKSUM_ALGO
 from src.features.config.schemas.entities import EntitiesConfig, EntityConfig
 from src.features.config.schemas.sources import SourceConfig, SourcesConfig
 from src.features.config.schemas.topics import TopicsConfig
 
 
+# Characters of normalized JSON encoded per hasher update
+_HASH_CHUNK_CHARS = 64 * 1024
+
+
+def _sort_keys(value: Any) -> Any:
+    """Recursively rebuild dicts with their keys in sorted order.
+
+    Args:
+        value: JSON-compatible value.
+
+    Returns:
+        Equivalent value with every nested dict key-sorted.
+    """
+    if isinstance(value, dict):
+        return {key: _sort_keys(value[key]) for key in sorted(value)}
+    if isinstance(value, list):
+        return [_sort_keys(item) for item in value]
+    return value
+
+
 class EffectiveConfig(StrictBaseModel):
     """Combined effective configuration for a run.
 
@@ -38,29 +60,66 @@ class EffectiveConfig(StrictBaseModel):
         Returns:
             Dictionary representation with sorted keys at all levels.
         """
-        result: dict[str, object] = json.loads(self.to_normalized_json())
+        result: dict[str, object] = _sort_keys(self.model_dump(mode="json"))
         return result
 
     def to_normalized_json(self) -> str:
         """Convert to normalized JSON with stable ordering.
 
         This ensures idempotent serialization - repeated calls produce
-        identical output.
+        identical output. The result is computed once per instance.
 
         Returns:
             JSON string with sorted keys.
         """
-        data = self.model_dump(mode="json")
-        return json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return self._normalized_json
 
     def compute_checksum(self) -> str:
         """Compute SHA-256 checksum of normalized configuration.
 
+        The checksum is computed once per instance.
+
         Returns:
             Hex-encoded SHA-256 checksum.
         """
-        normalized = self.to_normalized_json()
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return self._checksum
+
+    @cached_property
+    def _normalized_json(self) -> str:
+        """Normalized JSON, serialized on first use.
+
+        The exact byte format (sorted keys, compact separators, non-ASCII
+        escaped) feeds the recorded config checksum, so it must not depend on
+        which JSON encoder happens to be installed.
+        """
+        data = self.model_dump(mode="json")
+        return json.dumps(
+            data, sort_keys=True, separators=(",", ":"), ensure_ascii=True
+        )
+
+    @cached_property
+    def _checksum(self) -> str:
+        """SHA-256 of the normalized JSON, computed on first use.
+
+        The JSON is encoded slice by slice so hashing never holds a second,
+        full-size bytes copy of the serialized config.
+        """
+        normalized = self._normalized_json
+        hasher = hashlib.new(CHECKSUM_ALGO)
+        for start in range(0, len(normalized), _HASH_CHUNK_CHARS):
+            chunk = normalized[start : start + _HASH_CHUNK_CHARS]
+            hasher.update(chunk.encode("utf-8"))
+        return hasher.hexdigest()
+
+    @cached_property
+    def _sources_by_id(self) -> dict[str, SourceConfig]:
+        """Index of source configurations by ID, built on first lookup."""
+        return {source.id: source for source in self.sources.sources}
+
+    @cached_property
+    def _entities_by_id(self) -> dict[str, EntityConfig]:
+        """Index of entity configurations by ID, built on first lookup."""
+        return {entity.id: entity for entity in self.entities.entities}
 
     def get_source_by_id(self, source_id: str) -> SourceConfig | None:
         """Get a source configuration by ID.
@@ -71,10 +130,7 @@ class EffectiveConfig(StrictBaseModel):
         Returns:
             SourceConfig if found, None otherwise.
         """
-        for source in self.sources.sources:
-            if source.id == source_id:
-                return source
-        return None
+        return self._sources_by_id.get(source_id)
 
     def get_entity_by_id(self, entity_id: str) -> EntityConfig | None:
         """Get an entity configuration by ID.
@@ -85,10 +141,24 @@ class EffectiveConfig(StrictBaseModel):
         Returns:
             EntityConfig if found, None otherwise.
         """
+        return self._entities_by_id.get(entity_id)
+
+    @cached_property
+    def _enabled_sources(self) -> tuple[SourceConfig, ...]:
+        """Enabled source configurations, filtered on first use."""
+        return tuple(s for s in self.sources.sources if s.enabled)
+
+    @cached_property
+    def _entities_by_region(self) -> dict[str, tuple[EntityConfig, ...]]:
+        """Entity configurations grouped by region, built on first use.
+
+        EntityRegion is a str enum, so its members hash and compare equal to
+        their values and serve directly as keys for plain-string lookups.
+        """
+        grouped: dict[str, list[EntityConfig]] = {}
         for entity in self.entities.entities:
-            if entity.id == entity_id:
-                return entity
-        return None
+            grouped.setdefault(entity.region, []).append(entity)
+        return {region: tuple(entities) for region, entities in grouped.items()}
 
     def get_enabled_sources(self) -> list[SourceConfig]:
         """Get all enabled sources.
@@ -96,7 +166,7 @@ class EffectiveConfig(StrictBaseModel):
         Returns:
             List of enabled source configurations.
         """
-        return [s for s in self.sources.sources if s.enabled]
+        return list(self._enabled_sources)
 
     def get_entities_by_region(self, region: str) -> list[EntityConfig]:
         """Get entities by region.
@@ -107,7 +177,7 @@ class EffectiveConfig(StrictBaseModel):
         Returns:
             List of matching entity configurations.
         """
-        return [e for e in self.entities.entities if e.region.value == region]
+        return list(self._entities_by_region.get(region, ()))
 
     def summary(self) -> dict[str, object]:
         """Get a summary of the effective configuration.
@@ -118,9 +188,9 @@ class EffectiveConfig(StrictBaseModel):
         return {
             "run_id": self.run_id,
             "sources_count": len(self.sources.sources),
-            "enabled_sources_count": len(self.get_enabled_sources()),
+            "enabled_sources_count": len(self._enabled_sources),
             "entities_count": len(self.entities.entities),
             "topics_count": len(self.topics.topics),
             "config_checksum": self.compute_checksum(),
-            "file_checksums": self.file_checksums,
+            "file_checksums": dict(self.file_checksums),
         }
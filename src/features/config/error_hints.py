@@ -48,6 +48,9 @@ FIELD_HINTS: Final[dict[str, str]] = {
     "weight": "Must be between 0.0 and 5.0.",
 }
 
+# Hint used when neither the field nor the error type has a specific hint
+DEFAULT_HINT: Final[str] = "Check the configuration documentation for valid values."
+
 
 def get_error_hint(error_type: str, field_name: str | None = None) -> str:
     """Get a user-friendly hint for a validation error.
@@ -62,14 +65,12 @@ def get_error_hint(error_type: str, field_name: str | None = None) -> str:
     # Check for field-specific hint first
     if field_name:
         # Extract the last part of the field path (e.g., 'sources.0.id' -> 'id')
-        simple_field = field_name.split(".")[-1]
-        if simple_field in FIELD_HINTS:
-            return FIELD_HINTS[simple_field]
+        field_hint = FIELD_HINTS.get(field_name.rpartition(".")[2])
+        if field_hint is not None:
+            return field_hint
 
     # Fall back to error type hint
-    return ERROR_HINTS.get(
-        error_type, "Check the configuration documentation for valid values."
-    )
+    return ERROR_HINTS.get(error_type, DEFAULT_HINT)
 
 
 def format_validation_error(
@@ -10,6 +10,7 @@ import structlog
 import yaml
 from pydantic import ValidationError
 
+from src.features.config.constants import CHECKSUM_ALGO
 from src.features.config.schemas.entities import EntitiesConfig
 from src.features.config.schemas.sources import SourcesConfig
 from src.features.config.schemas.topics import TopicsConfig
@@ -83,7 +84,7 @@ class ConfigLoader:
 
     def _compute_checksum(self, content: bytes) -> str:
         """Compute SHA-256 checksum of content."""
-        return hashlib.sha256(content).hexdigest()
+        return hashlib.new(CHECKSUM_ALGO, content).hexdigest()
 
     def _load_yaml_file(self, file_path: Path) -> tuple[dict[str, object], str]:
         """Load a YAML file and compute its checksum.
@@ -199,8 +200,9 @@ class ConfigLoader:
                 config_validation_duration_ms=self._validation_duration_ms,
             )
 
-            # Create effective config and transition to READY
-            effective = EffectiveConfig(
+            # Create effective config and transition to READY. The nested
+            # configs were validated above, so skip a second validation pass.
+            effective = EffectiveConfig.model_construct(
                 sources=self._sources,
                 entities=self._entities,
                 topics=self._topics,
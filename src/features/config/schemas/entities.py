@@ -1,11 +1,13 @@
 """Entity configuration schema."""
 
+from collections import Counter
 from enum import Enum
 from typing import Annotated
 
 from pydantic import Field, model_validator
 
 from src.data_model import StrictBaseModel
+from src.features.config.constants import CONFIG_ID_PATTERN, SCHEMA_VERSION_PATTERN
 from src.features.config.schemas.base import LinkType
 
 
@@ -41,7 +43,7 @@ class EntityConfig(StrictBaseModel):
         aliases: Alternative names for the entity.
     """
 
-    id: Annotated[str, Field(min_length=1, max_length=100, pattern=r"^[a-z0-9_-]+$")]
+    id: Annotated[str, Field(min_length=1, max_length=100, pattern=CONFIG_ID_PATTERN)]
     name: Annotated[str, Field(min_length=1, max_length=200)]
     region: EntityRegion
     entity_type: EntityType = EntityType.ORGANIZATION
@@ -52,10 +54,9 @@ class EntityConfig(StrictBaseModel):
     @model_validator(mode="after")
     def validate_keywords_non_empty(self) -> "EntityConfig":
         """Ensure keywords list contains non-empty strings."""
-        for keyword in self.keywords:
-            if not keyword.strip():
-                msg = "Keywords must be non-empty strings"
-                raise ValueError(msg)
+        if any(not kw or kw.isspace() for kw in self.keywords):
+            msg = "Keywords must be non-empty strings"
+            raise ValueError(msg)
         return self
 
 
@@ -67,15 +68,15 @@ class EntitiesConfig(StrictBaseModel):
         entities: List of entity configurations.
     """
 
-    version: Annotated[str, Field(pattern=r"^\d+\.\d+$")] = "1.0"
+    version: Annotated[str, Field(pattern=SCHEMA_VERSION_PATTERN)] = "1.0"
     entities: list[EntityConfig]
 
     @model_validator(mode="after")
     def validate_unique_ids(self) -> "EntitiesConfig":
         """Ensure all entity IDs are unique."""
-        ids = [e.id for e in self.entities]
-        duplicates = [id_ for id_ in ids if ids.count(id_) > 1]
+        counts = Counter(e.id for e in self.entities)
+        duplicates = {id_ for id_, count in counts.items() if count > 1}
         if duplicates:
-            msg = f"Duplicate entity IDs found: {set(duplicates)}"
+            msg = f"Duplicate entity IDs found: {duplicates}"
             raise ValueError(msg)
         return self
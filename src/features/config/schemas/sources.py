@@ -1,10 +1,18 @@
 """Source configuration schema."""
 
-from typing import Annotated
+from collections import Counter
+from typing import Annotated, Any
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import (
+    Field,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 
 from src.data_model import StrictBaseModel
+from src.features.config.constants import CONFIG_ID_PATTERN, SCHEMA_VERSION_PATTERN
 from src.features.config.schemas.base import SourceKind, SourceMethod, SourceTier
 
 
@@ -16,6 +24,9 @@ __all__ = [
     "SourceTier",
 ]
 
+# Credential-bearing headers that must come from the environment, casefolded
+_FORBIDDEN_HEADERS = frozenset({"authorization", "cookie", "x-api-key"})
+
 
 class SourceConfig(StrictBaseModel):
     """Configuration for a single source.
@@ -32,9 +43,13 @@ class SourceConfig(StrictBaseModel):
         enabled: Whether the source is enabled.
         headers: Optional custom headers for requests.
         query: Optional query string (for API sources).
+        sanitize: Whether feed parsing sanitizes HTML and resolves relative
+            URIs. Disable only for trusted feeds to skip that work. Left out
+            of serialized output while at its default, so configs that do not
+            set it keep their normalized JSON and checksum.
     """
 
-    id: Annotated[str, Field(min_length=1, max_length=100, pattern=r"^[a-z0-9_-]+$")]
+    id: Annotated[str, Field(min_length=1, max_length=100, pattern=CONFIG_ID_PATTERN)]
     name: Annotated[str, Field(min_length=1, max_length=200)]
     url: Annotated[str, Field(min_length=1)]
     tier: SourceTier
@@ -45,6 +60,7 @@ class SourceConfig(StrictBaseModel):
     enabled: bool = True
     headers: dict[str, str] = Field(default_factory=dict)
     query: str | None = None
+    sanitize: bool = True
 
     @field_validator("url")
     @classmethod
@@ -59,13 +75,22 @@ class SourceConfig(StrictBaseModel):
     @classmethod
     def validate_no_auth_headers(cls, v: dict[str, str]) -> dict[str, str]:
         """Ensure no Authorization headers are stored in config."""
-        forbidden = {"authorization", "cookie", "x-api-key"}
         for key in v:
-            if key.lower() in forbidden:
+            if key.casefold() in _FORBIDDEN_HEADERS:
                 msg = f"Header '{key}' must not be stored in config; use environment variables"
                 raise ValueError(msg)
         return v
 
+    @model_serializer(mode="wrap")
+    def _omit_default_sanitize(
+        self, handler: SerializerFunctionWrapHandler
+    ) -> dict[str, Any]:
+        """Drop sanitize from serialized output while it has its default value."""
+        data: dict[str, Any] = handler(self)
+        if self.sanitize:
+            data.pop("sanitize", None)
+        return data
+
 
 class SourcesConfig(StrictBaseModel):
     """Root configuration for sources.yaml.
@@ -76,16 +101,16 @@ class SourcesConfig(StrictBaseModel):
         sources: List of source configurations.
     """
 
-    version: Annotated[str, Field(pattern=r"^\d+\.\d+$")] = "1.0"
+    version: Annotated[str, Field(pattern=SCHEMA_VERSION_PATTERN)] = "1.0"
     defaults: dict[str, str | int | bool] = Field(default_factory=dict)
     sources: list[SourceConfig]
 
     @model_validator(mode="after")
     def validate_unique_ids(self) -> "SourcesConfig":
         """Ensure all source IDs are unique."""
-        ids = [s.id for s in self.sources]
-        duplicates = [id_ for id_ in ids if ids.count(id_) > 1]
+        counts = Counter(s.id for s in self.sources)
+        duplicates = {id_ for id_, count in counts.items() if count > 1}
         if duplicates:
-            msg = f"Duplicate source IDs found: {set(duplicates)}"
+            msg = f"Duplicate source IDs found: {duplicates}"
             raise ValueError(msg)
         return self
@@ -5,6 +5,7 @@ from typing import Annotated
 from pydantic import Field, model_validator
 
 from src.data_model import StrictBaseModel
+from src.features.config.constants import SCHEMA_VERSION_PATTERN
 from src.features.config.schemas.base import LinkType
 
 
@@ -67,10 +68,9 @@ class TopicConfig(StrictBaseModel):
     @model_validator(mode="after")
     def validate_keywords_non_empty(self) -> "TopicConfig":
         """Ensure keywords list contains non-empty strings."""
-        for keyword in self.keywords:
-            if not keyword.strip():
-                msg = "Keywords must be non-empty strings"
-                raise ValueError(msg)
+        if any(not kw or kw.isspace() for kw in self.keywords):
+            msg = "Keywords must be non-empty strings"
+            raise ValueError(msg)
         return self
 
 
@@ -119,10 +119,9 @@ class QuotasConfig(StrictBaseModel):
     @model_validator(mode="after")
     def validate_paper_exclusion_keywords(self) -> "QuotasConfig":
         """Ensure paper exclusion keywords are non-empty strings."""
-        for keyword in self.paper_exclusion_keywords:
-            if not keyword.strip():
-                msg = "paper_exclusion_keywords must contain non-empty strings"
-                raise ValueError(msg)
+        if any(not kw or kw.isspace() for kw in self.paper_exclusion_keywords):
+            msg = "paper_exclusion_keywords must contain non-empty strings"
+            raise ValueError(msg)
         return self
 
 
@@ -138,7 +137,7 @@ class TopicsConfig(StrictBaseModel):
         prefer_primary_link_order: Preferred link types for primary link selection.
     """
 
-    version: Annotated[str, Field(pattern=r"^\d+\.\d+$")] = "1.0"
+    version: Annotated[str, Field(pattern=SCHEMA_VERSION_PATTERN)] = "1.0"
     dedupe: DedupeConfig = Field(default_factory=DedupeConfig)
     scoring: ScoringConfig = Field(default_factory=ScoringConfig)
     quotas: QuotasConfig = Field(default_factory=QuotasConfig)
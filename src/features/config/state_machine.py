@@ -22,6 +22,10 @@ class ConfigState(Enum):
     FAILED = auto()
 
 
+# Shared fallback for states without an entry in the transition table
+_NO_TRANSITIONS: frozenset[ConfigState] = frozenset()
+
+
 class ConfigStateError(Exception):
     """Raised when an invalid state transition is attempted."""
 
@@ -45,12 +49,14 @@ class ConfigStateMachine:
     Enforces valid state transitions during configuration loading process.
     """
 
-    VALID_TRANSITIONS: ClassVar[dict[ConfigState, set[ConfigState]]] = {
-        ConfigState.UNLOADED: {ConfigState.LOADING, ConfigState.FAILED},
-        ConfigState.LOADING: {ConfigState.VALIDATED, ConfigState.FAILED},
-        ConfigState.VALIDATED: {ConfigState.READY, ConfigState.FAILED},
-        ConfigState.READY: {ConfigState.FAILED},
-        ConfigState.FAILED: set(),  # Terminal state
+    __slots__ = ("_state",)
+
+    VALID_TRANSITIONS: ClassVar[dict[ConfigState, frozenset[ConfigState]]] = {
+        ConfigState.UNLOADED: frozenset({ConfigState.LOADING, ConfigState.FAILED}),
+        ConfigState.LOADING: frozenset({ConfigState.VALIDATED, ConfigState.FAILED}),
+        ConfigState.VALIDATED: frozenset({ConfigState.READY, ConfigState.FAILED}),
+        ConfigState.READY: frozenset({ConfigState.FAILED}),
+        ConfigState.FAILED: frozenset(),  # Terminal state
     }
 
     def __init__(self) -> None:
@@ -71,7 +77,7 @@ class ConfigStateMachine:
         Returns:
             True if the transition is valid, False otherwise.
         """
-        return to_state in self.VALID_TRANSITIONS.get(self._state, set())
+        return to_state in self.VALID_TRANSITIONS.get(self._state, _NO_TRANSITIONS)
 
     def transition(self, to_state: ConfigState) -> None:
         """Transition to a new state.
@@ -1,6 +1,7 @@
 """Evidence capture for configuration snapshots and reports."""
 
 import json
+import os
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -33,7 +34,7 @@ logger = structlog.get_logger()
 __all__ = ["ArtifactInfo", "ArtifactManifest", "EvidenceCapture", "EvidenceWriteError"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactManifest:
     """Manifest of all generated artifacts for a run.
 
@@ -245,7 +246,7 @@ class EvidenceCapture:
             self.ensure_directories()
 
             summary = config.summary()
-            now = datetime.now(UTC).isoformat()
+            now = datetime.now(UTC)
 
             # Extract file checksums from summary
             file_checksums_raw = summary.get("file_checksums", {})
@@ -257,7 +258,7 @@ class EvidenceCapture:
             template_data = StateTemplateData(
                 feature_key=self._feature_key,
                 status=status,
-                last_updated=now,
+                last_updated=now.isoformat(),
                 run_id=self._run_id,
                 git_commit=self._git_commit,
                 started_at=self._start_time.isoformat(),
@@ -276,7 +277,7 @@ class EvidenceCapture:
             self._write_file_safely(state_path, content, "md")
 
             # Also write the snapshot
-            self._write_snapshot(config)
+            self._write_snapshot(config, summary, now)
 
             duration_ms = (time.time() - start_time) * 1000
             self._metrics.record_write_duration(duration_ms)
@@ -294,24 +295,28 @@ class EvidenceCapture:
             log.exception("state_md_write_failed", error=str(e))
             raise
 
-    def _write_snapshot(self, config: "EffectiveConfig") -> Path:
+    def _write_snapshot(
+        self, config: "EffectiveConfig", summary: dict[str, object], now: datetime
+    ) -> Path:
         """Write configuration snapshot to snapshots directory.
 
         Args:
             config: Effective configuration.
+            summary: Configuration summary already computed by the caller.
+            now: Time of the STATE.md update this snapshot belongs to.
 
         Returns:
             Path to the snapshot file.
         """
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         snapshot_path = self._snapshots_dir / f"config_snapshot_{timestamp}.json"
 
         snapshot_data = {
             "run_id": self._run_id,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": now.isoformat(),
             "git_commit": self._git_commit,
             "config": config.to_normalized_dict(),
-            "summary": config.summary(),
+            "summary": summary,
         }
 
         content = json.dumps(snapshot_data, sort_keys=True, indent=2)
@@ -328,15 +333,22 @@ class EvidenceCapture:
         Args:
             keep: Number of snapshots to keep.
         """
-        snapshots = sorted(
-            self._snapshots_dir.glob("config_snapshot_*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
+        # Names embed a UTC YYYYMMDD_HHMMSS stamp, so they sort chronologically
+        with os.scandir(self._snapshots_dir) as it:
+            snapshots = sorted(
+                (
+                    entry
+                    for entry in it
+                    if entry.name.startswith("config_snapshot_")
+                    and entry.name.endswith(".json")
+                ),
+                key=lambda entry: entry.name,
+                reverse=True,
+            )
 
         for snapshot in snapshots[keep:]:
-            snapshot.unlink()
-            logger.debug("snapshot_pruned", file_path=str(snapshot))
+            os.unlink(snapshot.path)
+            logger.debug("snapshot_pruned", file_path=snapshot.path)
 
     def write_e2e_report(
         self,
@@ -101,13 +101,16 @@ def redact_content(content: str) -> str:
 def contains_secrets(content: str) -> bool:
     """Check if content contains any secrets.
 
+    Stops at the first pattern that matches, without collecting the
+    matches that scan_for_secrets would report.
+
     Args:
         content: Text content to check.
 
     Returns:
         True if secrets are detected, False otherwise.
     """
-    return len(scan_for_secrets(content)) > 0
+    return any(pattern.search(content) for _, pattern in SECRET_PATTERNS)
 
 
 def get_secret_patterns() -> list[str]:
@@ -88,7 +88,8 @@ def render_state_md(data: StateTemplateData) -> str:
     Returns:
         Rendered markdown content.
     """
-    content = f"""# STATE.md - {data.feature_key}
+    parts = [
+        f"""# STATE.md - {data.feature_key}
 
 ## Status
 
@@ -115,57 +116,63 @@ def render_state_md(data: StateTemplateData) -> str:
 | File | SHA-256 |
 |------|---------|
 """
-    for file_path, checksum in sorted(data.file_checksums.items()):
-        content += f"| {file_path} | {checksum} |\n"
+    ]
+    parts.extend(
+        f"| {file_path} | {checksum} |\n"
+        for file_path, checksum in sorted(data.file_checksums.items())
+    )
 
-    content += f"""
+    parts.append(f"""
 ## Validation Result
 
 - **Result**: {data.validation_result}
 - **Error Count**: 0
-"""
+""")
 
     if data.db_stats:
-        content += """
+        parts.append("""
 ## Database Statistics
 
 | Table | Row Count |
 |-------|-----------|
-"""
-        for table, count in sorted(data.db_stats.items()):
-            content += f"| {table} | {count} |\n"
+""")
+        parts.extend(
+            f"| {table} | {count} |\n" for table, count in sorted(data.db_stats.items())
+        )
 
     if data.per_source_counts:
-        content += """
+        parts.append("""
 ## Per-Source Item Counts
 
 | Source ID | Items |
 |-----------|-------|
-"""
-        for source_id, count in sorted(data.per_source_counts.items()):
-            content += f"| {source_id} | {count} |\n"
+""")
+        parts.extend(
+            f"| {source_id} | {count} |\n"
+            for source_id, count in sorted(data.per_source_counts.items())
+        )
 
-    content += """
+    parts.append("""
 ## Artifact Manifest
 
 | Path | SHA-256 | Bytes | Type |
 |------|---------|-------|------|
-"""
-    for artifact in sorted(data.artifacts, key=lambda a: a.path):
-        content += (
-            f"| {artifact.path} | {artifact.checksum[:16]}... | "
-            f"{artifact.bytes_written} | {artifact.artifact_type} |\n"
-        )
-
-    content += f"""
+""")
+    parts.extend(
+        f"| {artifact.path} | {artifact.checksum[:16]}... | "
+        f"{artifact.bytes_written} | {artifact.artifact_type} |\n"
+        for artifact in sorted(data.artifacts, key=lambda a: a.path)
+    )
+
+    parts.append(f"""
 ## Configuration Snapshots
 
 Latest snapshot: {data.last_updated}
 
 {data.additional_notes}
-"""
+""")
 
-    return content
+    return "".join(parts)
 
 
 def render_e2e_report(data: E2EReportTemplateData) -> str:
@@ -179,7 +186,8 @@ def render_e2e_report(data: E2EReportTemplateData) -> str:
     """
     status = "PASSED" if data.passed else "FAILED"
 
-    content = f"""# E2E Run Report - {data.feature_key}
+    parts = [
+        f"""# E2E Run Report - {data.feature_key}
 
 ## Summary
 
@@ -191,35 +199,37 @@ def render_e2e_report(data: E2EReportTemplateData) -> str:
 - **Duration**: {data.duration_seconds:.2f}s
 
 """
+    ]
 
     if data.cleared_data_steps:
-        content += """## Cleared Data Steps
+        parts.append("""## Cleared Data Steps
 
-"""
-        for i, step in enumerate(data.cleared_data_steps, 1):
-            content += f"{i}. {step}\n"
-        content += "\n"
+""")
+        parts.extend(
+            f"{i}. {step}\n" for i, step in enumerate(data.cleared_data_steps, 1)
+        )
+        parts.append("\n")
 
-    content += """## Steps Performed
+    parts.append("""## Steps Performed
 
-"""
-    for i, step in enumerate(data.steps_performed, 1):
-        content += f"{i}. {step}\n"
+""")
+    parts.extend(f"{i}. {step}\n" for i, step in enumerate(data.steps_performed, 1))
 
-    content += """
+    parts.append("""
 ## Artifacts
 
 | Artifact | Path/Checksum |
 |----------|---------------|
-"""
-    for name, value in sorted(data.artifacts.items()):
-        content += f"| {name} | {value} |\n"
+""")
+    parts.extend(
+        f"| {name} | {value} |\n" for name, value in sorted(data.artifacts.items())
+    )
 
     if data.notes:
-        content += f"""
+        parts.append(f"""
 ## Notes
 
 {data.notes}
-"""
+""")
 
-    return content
+    return "".join(parts)
@@ -110,8 +110,8 @@ class EvidenceWriter:
         Returns:
             Hex-encoded SHA-256 checksum.
         """
-        content = file_path.read_bytes()
-        return self.compute_checksum(content)
+        with file_path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
     def write_safely(
         self,
@@ -159,7 +159,7 @@ class EvidenceWriter:
             content_bytes = content.encode("utf-8")
             checksum = self.compute_checksum(content_bytes)
 
-            file_path.write_text(content)
+            file_path.write_bytes(content_bytes)
 
             bytes_written = len(content_bytes)
             artifact = ArtifactInfo(
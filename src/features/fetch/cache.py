@@ -3,6 +3,7 @@
 Encapsulates all cache-related logic for conditional requests (ETag/Last-Modified).
 """
 
+import threading
 from datetime import UTC, datetime
 from typing import Protocol
 
@@ -41,6 +42,22 @@ class CacheStore(Protocol):
         """
         ...
 
+    def get_all_http_cache(self) -> dict[str, HttpCacheEntry]:
+        """Retrieve cached HTTP metadata for every source.
+
+        Returns:
+            Mapping of source ID to cached entry.
+        """
+        ...
+
+    def upsert_http_cache_headers_many(self, entries: list[HttpCacheEntry]) -> None:
+        """Store or update HTTP cache metadata for several sources at once.
+
+        Args:
+            entries: Cache entries to store.
+        """
+        ...
+
 
 class CacheManager:
     """Manages HTTP cache operations for conditional requests.
@@ -49,6 +66,7 @@ class CacheManager:
     - Building conditional request headers (If-None-Match, If-Modified-Since)
     - Updating cache entries after fetch operations
     - Preserving existing cache headers on 304 responses
+    - Optionally preloading all validators and deferring writes to one batch
     """
 
     def __init__(self, store: CacheStore, run_id: str) -> None:
@@ -60,6 +78,64 @@ class CacheManager:
         """
         self._store = store
         self._log = logger.bind(component="cache", run_id=run_id)
+        self._lock = threading.Lock()
+        self._preloaded: dict[str, HttpCacheEntry] | None = None
+        self._pending: dict[str, HttpCacheEntry] = {}
+
+    @property
+    def is_preloaded(self) -> bool:
+        """Check if validators are served from the in-memory snapshot."""
+        return self._preloaded is not None
+
+    def preload(self) -> None:
+        """Load all cached validators in one query and defer writes.
+
+        Until flush() is called, lookups are answered from memory and updates
+        are buffered, so a run touches the http_cache table twice in total
+        instead of two to three times per source.
+        """
+        entries = self._store.get_all_http_cache()
+        with self._lock:
+            self._preloaded = entries
+            self._pending = {}
+        self._log.debug("cache_preloaded", entries=len(entries))
+
+    def flush(self) -> None:
+        """Persist buffered updates in a single batch and stop preloading."""
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending = {}
+            self._preloaded = None
+
+        self._store.upsert_http_cache_headers_many(pending)
+        self._log.debug("cache_flushed", entries=len(pending))
+
+    def _get_entry(self, source_id: str) -> HttpCacheEntry | None:
+        """Look up a cache entry from the snapshot or the store.
+
+        Args:
+            source_id: Source identifier to look up.
+
+        Returns:
+            Cached entry if exists, None otherwise.
+        """
+        with self._lock:
+            if self._preloaded is not None:
+                return self._preloaded.get(source_id)
+        return self._store.get_http_cache(source_id)
+
+    def _put_entry(self, entry: HttpCacheEntry) -> None:
+        """Write a cache entry to the buffer or directly to the store.
+
+        Args:
+            entry: Cache entry to store.
+        """
+        with self._lock:
+            if self._preloaded is not None:
+                self._preloaded[entry.source_id] = entry
+                self._pending[entry.source_id] = entry
+                return
+        self._store.upsert_http_cache_headers(entry)
 
     def get_conditional_headers(self, source_id: str) -> dict[str, str]:
         """Get conditional request headers from cached data.
@@ -70,7 +146,7 @@ class CacheManager:
         Returns:
             Dictionary with If-None-Match and/or If-Modified-Since headers.
         """
-        cache_entry = self._store.get_http_cache(source_id)
+        cache_entry = self._get_entry(source_id)
         headers: dict[str, str] = {}
 
         if cache_entry:
@@ -107,7 +183,7 @@ class CacheManager:
                 last_status=result.status_code if result.status_code > 0 else None,
                 last_fetch_at=datetime.now(UTC),
             )
-            self._store.upsert_http_cache_headers(entry)
+            self._put_entry(entry)
             return
 
         # Extract cache headers from response
@@ -118,7 +194,7 @@ class CacheManager:
 
         # For 304, preserve existing cache headers
         if result.status_code == HTTP_STATUS_NOT_MODIFIED:
-            existing = self._store.get_http_cache(source_id)
+            existing = self._get_entry(source_id)
             if existing:
                 etag = etag or existing.etag
                 last_modified = last_modified or existing.last_modified
@@ -130,7 +206,7 @@ class CacheManager:
             last_status=result.status_code,
             last_fetch_at=datetime.now(UTC),
         )
-        self._store.upsert_http_cache_headers(entry)
+        self._put_entry(entry)
 
         self._log.debug(
             "cache_update",
@@ -149,5 +225,5 @@ class CacheManager:
         Returns:
             Last HTTP status code, or None if not cached.
         """
-        cache_entry = self._store.get_http_cache(source_id)
+        cache_entry = self._get_entry(source_id)
         return cache_entry.last_status if cache_entry else None
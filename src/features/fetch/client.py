@@ -1,6 +1,8 @@
 """HTTP client with caching, retries, and failure isolation."""
 
 import time
+from collections.abc import Generator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
 from io import BytesIO
@@ -69,6 +71,29 @@ class HttpFetcher:
             run_id=run_id,
         )
 
+    @contextmanager
+    def cache_batch(self) -> Generator[None]:
+        """Serve conditional-request validators from one preloaded snapshot.
+
+        All ETag/Last-Modified validators are read in a single query on entry
+        and every update made inside the block is written back in a single
+        transaction on exit. If the block raises, a failing flush is logged
+        rather than raised so the original exception propagates.
+
+        Yields:
+            None.
+        """
+        self._cache.preload()
+        try:
+            yield
+        except BaseException:
+            try:
+                self._cache.flush()
+            except Exception as e:
+                self._log.exception("cache_flush_failed", error=str(e))
+            raise
+        self._cache.flush()
+
     def fetch(
         self,
         source_id: str,
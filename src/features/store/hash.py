@@ -8,6 +8,10 @@ import hashlib
 from datetime import datetime
 
 
+# Length of the hex digest prefix stored as content_hash
+CONTENT_HASH_LENGTH = 16
+
+
 def compute_content_hash(
     title: str,
     url: str,
@@ -20,6 +24,10 @@ def compute_content_hash(
     The hash is based on normalized title, canonical URL, optional publish date,
     and any extra fields provided.
 
+    SHA-256 is kept (rather than a faster non-standard hash) because stored
+    hashes must stay comparable across runs; hashlib's OpenSSL backend already
+    uses SHA-NI where the CPU provides it.
+
     Args:
         title: Item title (will be stripped and lowercased for normalization).
         url: Canonical URL (should already be canonicalized).
@@ -40,17 +48,13 @@ def compute_content_hash(
         ... )
         'x9y8z7w6v5u4t3s2'
     """
-    parts = [
-        f"title:{title.strip().lower()}",
-        f"url:{url}",
-    ]
+    parts = [f"title:{title.strip().lower()}", f"url:{url}"]
 
     if published_at:
         parts.append(f"published_at:{published_at.isoformat()}")
 
     if extra:
-        for key, value in sorted(extra.items()):
-            parts.append(f"{key}:{value}")
+        parts.extend(f"{key}:{value}" for key, value in sorted(extra.items()))
 
     content = "\n".join(parts)
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:CONTENT_HASH_LENGTH]
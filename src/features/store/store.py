@@ -442,65 +442,129 @@ class StateStore:
         Returns:
             Result indicating what happened.
         """
-        canonical_url = canonicalize_url(item.url, self._strip_params)
         now = datetime.now(UTC)
 
         with self._transaction("upsert_item") as ctx:
             conn = self._ensure_connected()
+            return self._upsert_in_transaction(conn, ctx, item, now)
 
-            # Check if item exists
-            cursor = conn.execute(
-                "SELECT url, content_hash, first_seen_at FROM items WHERE url = ?",
-                (canonical_url,),
+    def upsert_items(self, items: list[Item]) -> list[UpsertResult]:
+        """Upsert several items in a single transaction.
+
+        Applies the same semantics as upsert_item to each item in order, but
+        commits once for the whole batch instead of once per item. Each item
+        runs inside its own savepoint, so a failing item leaves the same state
+        as calling upsert_item in a loop: its own writes are rolled back, the
+        items before it are committed, the items after it are not attempted,
+        and its exception is re-raised.
+
+        Args:
+            items: The items to upsert.
+
+        Returns:
+            Results in the same order as the input items.
+        """
+        if not items:
+            return []
+
+        now = datetime.now(UTC)
+        results: list[UpsertResult] = []
+        failure: Exception | None = None
+
+        with self._transaction("upsert_items") as ctx:
+            conn = self._ensure_connected()
+            # Releasing the outermost savepoint would commit, so open the
+            # transaction explicitly and let _transaction commit it
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            for item in items:
+                conn.execute("SAVEPOINT upsert_item")
+                try:
+                    results.append(self._upsert_in_transaction(conn, ctx, item, now))
+                except Exception as e:  # noqa: BLE001
+                    conn.execute("ROLLBACK TO upsert_item")
+                    conn.execute("RELEASE upsert_item")
+                    failure = e
+                    break
+                conn.execute("RELEASE upsert_item")
+
+        if failure is not None:
+            raise failure
+        return results
+
+    def _upsert_in_transaction(
+        self,
+        conn: sqlite3.Connection,
+        ctx: TransactionContext,
+        item: Item,
+        now: datetime,
+    ) -> UpsertResult:
+        """Upsert a single item inside an open transaction.
+
+        Args:
+            conn: Database connection.
+            ctx: Transaction context for affected-row tracking.
+            item: The item to upsert.
+            now: Current timestamp.
+
+        Returns:
+            Result indicating what happened.
+        """
+        canonical_url = canonicalize_url(item.url, self._strip_params)
+
+        # Check if item exists
+        cursor = conn.execute(
+            "SELECT url, content_hash, first_seen_at FROM items WHERE url = ?",
+            (canonical_url,),
+        )
+        existing = cursor.fetchone()
+
+        if existing is None:
+            # New item
+            self._insert_new_item(conn, item, canonical_url, now)
+            ctx.add_affected_rows(1)
+            self._metrics.record_upsert()
+
+            result_item = self._build_result_item(
+                item, canonical_url, first_seen_at=now, last_seen_at=now
+            )
+            return UpsertResult(
+                event_type=ItemEventType.NEW, affected_rows=1, item=result_item
+            )
+
+        existing_hash = existing["content_hash"]
+        first_seen = datetime.fromisoformat(existing["first_seen_at"])
+
+        if existing_hash == item.content_hash:
+            # Unchanged - only update last_seen_at
+            conn.execute(
+                "UPDATE items SET last_seen_at = ? WHERE url = ?",
+                (now.isoformat(), canonical_url),
             )
-            existing = cursor.fetchone()
-
-            if existing is None:
-                # New item
-                self._insert_new_item(conn, item, canonical_url, now)
-                ctx.add_affected_rows(1)
-                self._metrics.record_upsert()
-
-                result_item = self._build_result_item(
-                    item, canonical_url, first_seen_at=now, last_seen_at=now
-                )
-                return UpsertResult(
-                    event_type=ItemEventType.NEW, affected_rows=1, item=result_item
-                )
-
-            existing_hash = existing["content_hash"]
-            first_seen = datetime.fromisoformat(existing["first_seen_at"])
-
-            if existing_hash == item.content_hash:
-                # Unchanged - only update last_seen_at
-                conn.execute(
-                    "UPDATE items SET last_seen_at = ? WHERE url = ?",
-                    (now.isoformat(), canonical_url),
-                )
-                ctx.add_affected_rows(1)
-                self._metrics.record_unchanged()
-
-                result_item = self._build_result_item(
-                    item, canonical_url, first_seen_at=first_seen, last_seen_at=now
-                )
-                return UpsertResult(
-                    event_type=ItemEventType.UNCHANGED,
-                    affected_rows=1,
-                    item=result_item,
-                )
-
-            # Updated - content_hash changed
-            self._update_item_content(conn, item, canonical_url, now)
             ctx.add_affected_rows(1)
-            self._metrics.record_update()
+            self._metrics.record_unchanged()
 
             result_item = self._build_result_item(
                 item, canonical_url, first_seen_at=first_seen, last_seen_at=now
             )
             return UpsertResult(
-                event_type=ItemEventType.UPDATED, affected_rows=1, item=result_item
+                event_type=ItemEventType.UNCHANGED,
+                affected_rows=1,
+                item=result_item,
             )
 
+        # Updated - content_hash changed
+        self._update_item_content(conn, item, canonical_url, now)
+        ctx.add_affected_rows(1)
+        self._metrics.record_update()
+
+        result_item = self._build_result_item(
+            item, canonical_url, first_seen_at=first_seen, last_seen_at=now
+        )
+        return UpsertResult(
+            event_type=ItemEventType.UPDATED, affected_rows=1, item=result_item
+        )
+
     def get_item(self, url: str) -> Item | None:
         """Get an item by URL.
 
@@ -690,6 +754,52 @@ class StateStore:
             )
             ctx.add_affected_rows(1)
 
+    def upsert_http_cache_headers_many(self, entries: list[HttpCacheEntry]) -> None:
+        """Upsert HTTP cache headers for several sources in one transaction.
+
+        Args:
+            entries: The cache entries to upsert.
+        """
+        if not entries:
+            return
+
+        with self._transaction("upsert_http_cache_many") as ctx:
+            conn = self._ensure_connected()
+            conn.executemany(
+                """
+                INSERT INTO http_cache (source_id, etag, last_modified, last_status, last_fetch_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(source_id) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    last_status = excluded.last_status,
+                    last_fetch_at = excluded.last_fetch_at
+                """,
+                [
+                    (
+                        entry.source_id,
+                        entry.etag,
+                        entry.last_modified,
+                        entry.last_status,
+                        entry.last_fetch_at.isoformat(),
+                    )
+                    for entry in entries
+                ],
+            )
+            ctx.add_affected_rows(len(entries))
+
+    def get_all_http_cache(self) -> dict[str, HttpCacheEntry]:
+        """Get every HTTP cache entry keyed by source ID.
+
+        Returns:
+            Mapping of source ID to cache entry.
+        """
+        conn = self._ensure_connected()
+        cursor = conn.execute("SELECT * FROM http_cache")
+        return {
+            row["source_id"]: self._row_to_http_cache(row) for row in cursor.fetchall()
+        }
+
     def get_http_cache(self, source_id: str) -> HttpCacheEntry | None:
         """Get HTTP cache entry for a source.
 
@@ -709,6 +819,17 @@ class StateStore:
         if row is None:
             return None
 
+        return self._row_to_http_cache(row)
+
+    def _row_to_http_cache(self, row: sqlite3.Row) -> HttpCacheEntry:
+        """Convert a database row to an HttpCacheEntry.
+
+        Args:
+            row: Database row.
+
+        Returns:
+            HttpCacheEntry instance.
+        """
         return HttpCacheEntry(
             source_id=row["source_id"],
             etag=row["etag"],
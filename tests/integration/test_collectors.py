@@ -342,6 +342,49 @@ class TestCollectorRunnerIntegration:
         stats = store.get_stats()
         assert stats["items"] == 3
 
+    def test_repeated_items_within_run_skip_store(
+        self,
+        store: StateStore,
+        mock_http_client: MagicMock,
+        rss_source: SourceConfig,
+    ) -> None:
+        """Items repeated across sources in one run are upserted only once."""
+        mock_http_client.fetch.return_value = FetchResult(
+            status_code=200,
+            final_url=rss_source.url,
+            headers={},
+            body_bytes=RSS_FEED_CONTENT,
+            cache_hit=False,
+            error=None,
+        )
+        mirror_source = rss_source.model_copy(update={"id": "test-rss-mirror"})
+
+        runner = CollectorRunner(
+            store=store,
+            http_client=mock_http_client,
+            run_id="test-run-001",
+            max_workers=1,
+        )
+        store.upsert_items = MagicMock(wraps=store.upsert_items)  # type: ignore[method-assign]
+
+        result = runner.run([rss_source, mirror_source], now=FIXED_NOW)
+
+        batches = [call.args[0] for call in store.upsert_items.call_args_list]
+        assert [len(batch) for batch in batches] == [3, 0]
+        assert result.total_new == 3
+        mirror_result = result.source_results["test-rss-mirror"]
+        assert mirror_result.items_unchanged == 3
+        assert len(mirror_result.upsert_results) == 3
+        first_items = [
+            r.item for r in result.source_results[rss_source.id].upsert_results
+        ]
+        for upsert_result, first_item in zip(
+            mirror_result.upsert_results, first_items, strict=True
+        ):
+            assert upsert_result.item.source_id == "test-rss-mirror"
+            assert upsert_result.item.url == first_item.url
+            assert upsert_result.item.first_seen_at == first_item.first_seen_at
+
     def test_deterministic_ordering(
         self,
         store: StateStore,
@@ -471,10 +514,13 @@ class TestCollectorRunnerIntegration:
             max_workers=1,
         )
 
+        store.upsert_items = MagicMock(wraps=store.upsert_items)  # type: ignore[method-assign]
+
         result = runner.run([rss_source], now=FIXED_NOW)
 
         # Should succeed with 0 items
         assert result.sources_succeeded == 1
         assert result.total_items == 0
+        store.upsert_items.assert_not_called()
         source_result = result.source_results["test-rss"]
         assert source_result.result.success is True
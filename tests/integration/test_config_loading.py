@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
+from src.features.config.effective import EffectiveConfig
 from src.features.config.loader import ConfigLoader
 from src.features.config.state_machine import ConfigState
 
@@ -31,6 +32,21 @@ class TestConfigLoaderIntegration:
         assert len(effective.entities.entities) == 24
         assert len(effective.topics.topics) == 26
 
+    @pytest.mark.integration
+    def test_loaded_config_matches_validated_config(self) -> None:
+        """Test that the loaded config equals a fully validated equivalent."""
+        loader = ConfigLoader(run_id="test-run-001")
+
+        effective = loader.load(
+            sources_path=FIXTURES_DIR / "sources.yaml",
+            entities_path=FIXTURES_DIR / "entities.yaml",
+            topics_path=FIXTURES_DIR / "topics.yaml",
+        )
+
+        validated = EffectiveConfig.model_validate(effective.model_dump())
+        assert validated == effective
+        assert validated.compute_checksum() == effective.compute_checksum()
+
     @pytest.mark.integration
     def test_load_produces_checksums(self) -> None:
         """Test that loading produces file checksums."""
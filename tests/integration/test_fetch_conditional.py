@@ -1,5 +1,6 @@
 """Integration tests for HTTP conditional requests with ETag/Last-Modified."""
 
+import sqlite3
 import tempfile
 import threading
 from collections.abc import Generator
@@ -276,6 +277,70 @@ class TestConditionalRequests:
             reduction = (first_bytes - second_bytes) / first_bytes * 100
             assert reduction >= 80, f"Payload reduction was only {reduction}%"
 
+    def test_cache_batch_defers_writes_until_exit(
+        self,
+        store: StateStore,
+        caching_server: HTTPServer,
+    ) -> None:
+        """Test that validators inside cache_batch are persisted on exit."""
+        FetchMetrics.reset()
+        url = get_server_url(caching_server)
+
+        config = FetchConfig(retry_policy=RetryPolicy(max_retries=0))
+        fetcher = HttpFetcher(config=config, store=store, run_id="test-run")
+
+        with fetcher.cache_batch():
+            result1 = fetcher.fetch(source_id="test-source", url=url)
+            assert result1.status_code == 200
+            assert store.get_http_cache("test-source") is None
+
+            # Validators are served from the in-memory snapshot
+            result2 = fetcher.fetch(source_id="test-source", url=url)
+            assert result2.status_code == 304
+
+        cache = store.get_http_cache("test-source")
+        assert cache is not None
+        assert cache.etag == '"abc123"'
+        assert cache.last_status == 304
+
+    def test_cache_batch_uses_preloaded_validators(
+        self,
+        store: StateStore,
+        caching_server: HTTPServer,
+    ) -> None:
+        """Test that validators persisted by a previous run are preloaded."""
+        FetchMetrics.reset()
+        url = get_server_url(caching_server)
+
+        config = FetchConfig(retry_policy=RetryPolicy(max_retries=0))
+        HttpFetcher(config=config, store=store, run_id="run-1").fetch(
+            source_id="test-source", url=url
+        )
+
+        fetcher = HttpFetcher(config=config, store=store, run_id="run-2")
+        with fetcher.cache_batch():
+            result = fetcher.fetch(source_id="test-source", url=url)
+
+        assert result.cache_hit is True
+        assert store.get_all_http_cache().keys() == {"test-source"}
+
+    def test_cache_batch_flush_failure_keeps_block_error(
+        self,
+        store: StateStore,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a failing flush does not mask the block's exception."""
+        config = FetchConfig(retry_policy=RetryPolicy(max_retries=0))
+        fetcher = HttpFetcher(config=config, store=store, run_id="test-run")
+
+        def failing_upsert(*args: object, **kwargs: object) -> None:
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(store, "upsert_http_cache_headers_many", failing_upsert)
+
+        with pytest.raises(ValueError, match="runner failed"), fetcher.cache_batch():
+            raise ValueError("runner failed")
+
 
 class TestRetryBehavior:
     """Integration tests for retry behavior with 5xx errors."""
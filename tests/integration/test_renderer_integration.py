@@ -5,10 +5,20 @@ import tempfile
 from collections.abc import Generator
 from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
-from src.features.config.schemas.base import LinkType
+from src.collectors.rss_atom import RssAtomCollector
+from src.features.config.schemas.base import (
+    LinkType,
+    SourceKind,
+    SourceMethod,
+    SourceTier,
+)
+from src.features.config.schemas.sources import SourceConfig
+from src.features.fetch.client import HttpFetcher
+from src.features.fetch.models import FetchResult
 from src.linker.models import Story, StoryLink
 from src.ranker.models import RankerOutput
 from src.renderer.metrics import RendererMetrics
@@ -207,6 +217,77 @@ class TestRendererIntegration:
         placeholder = (temp_output_dir / "day" / "2026-01-15.html").read_text()
         assert 'onerror="alert(1)"' not in placeholder
 
+    def test_render_unsanitized_feed_markup_stays_escaped_data(
+        self,
+        temp_output_dir: Path,
+    ) -> None:
+        """Markup from a sanitize=False source is rendered only as escaped JSON."""
+        RendererMetrics.reset()
+
+        feed = b"""<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <item>
+                    <title>Trusted Article</title>
+                    <link>https://example.com/trusted</link>
+                    <description>&lt;p&gt;Body&lt;/p&gt;&lt;img src=x onerror="alert(1)"&gt;&lt;script&gt;x()&lt;/script&gt;</description>
+                    <pubDate>Wed, 14 Jan 2026 08:00:00 GMT</pubDate>
+                </item>
+            </channel>
+        </rss>"""
+        http_client = MagicMock(spec=HttpFetcher)
+        http_client.fetch.return_value = FetchResult(
+            status_code=200,
+            final_url="https://example.com/feed.xml",
+            body_bytes=feed,
+            headers={},
+        )
+        source = SourceConfig(
+            id="trusted-source",
+            name="Trusted Source",
+            url="https://example.com/feed.xml",
+            tier=SourceTier.TIER_0,
+            method=SourceMethod.RSS_ATOM,
+            kind=SourceKind.BLOG,
+            sanitize=False,
+        )
+
+        collected = RssAtomCollector().collect(
+            source_config=source,
+            http_client=http_client,
+            now=datetime(2026, 1, 15, 9, 0, 0, tzinfo=UTC),
+            lookback_hours=48,
+        )
+        (item,) = collected.items
+        summary = json.loads(item.raw_json)["summary"]
+        assert "<script>" in summary
+
+        story = create_story("trusted-story", item.title, item.url).model_copy(
+            update={"raw_items": [item]}
+        )
+        # Render for today so day-page retention keeps the placeholder
+        target_date = datetime.now(UTC).date().isoformat()
+        renderer = StaticRenderer(run_id="trusted-test", output_dir=temp_output_dir)
+        result = renderer.render(
+            ranker_output=RankerOutput(
+                top5=[story], model_releases_by_entity={}, papers=[], radar=[]
+            ),
+            sources_status=[],
+            run_info=RunInfo(run_id="trusted-test", started_at=datetime.now(UTC)),
+            recent_runs=[],
+            target_date=target_date,
+        )
+
+        assert result.success
+        raw = (temp_output_dir / "api" / "daily.json").read_text()
+        # Quotes inside the markup are escaped, so it cannot leave its JSON string
+        assert 'onerror=\\"alert(1)\\"' in raw
+        assert json.loads(raw)["top5"][0]["summary"] == summary
+
+        placeholder = (temp_output_dir / "day" / f"{target_date}.html").read_text()
+        assert "<script>" not in placeholder
+        assert "onerror" not in placeholder
+
     def test_render_preserves_existing_day_pages(
         self,
         temp_output_dir: Path,
@@ -219,6 +219,71 @@ class TestItemOperations:
         assert result2.item.title == "Test Article (Updated)"
         assert result2.item.content_hash == "def456"
 
+    def test_upsert_items_batch(self, store: StateStore) -> None:
+        """Test batch upsert applies per-item semantics in input order."""
+        existing = Item(
+            url="https://example.com/existing",
+            source_id="test-source",
+            tier=0,
+            kind="blog",
+            title="Existing",
+            content_hash="abc123",
+            raw_json="{}",
+        )
+        store.upsert_item(existing)
+        new_item = existing.model_copy(
+            update={"url": "https://example.com/new", "title": "New"}
+        )
+        changed = existing.model_copy(update={"content_hash": "def456"})
+
+        results = store.upsert_items([new_item, existing, changed])
+
+        assert [r.event_type for r in results] == [
+            ItemEventType.NEW,
+            ItemEventType.UNCHANGED,
+            ItemEventType.UPDATED,
+        ]
+        assert store.get_stats()["items"] == 2
+        assert store.upsert_items([]) == []
+
+    def test_upsert_items_failure_keeps_earlier_items(
+        self, store: StateStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failing item rolls back only itself and stops the batch."""
+        items = [
+            Item(
+                url=f"https://example.com/{name}",
+                source_id="test-source",
+                tier=0,
+                kind="blog",
+                title=name,
+                content_hash="abc123",
+                raw_json="{}",
+            )
+            for name in ("first", "bad", "after")
+        ]
+        build_result_item = store._build_result_item
+
+        def fail_on_bad(
+            item: Item,
+            canonical_url: str,
+            first_seen_at: datetime,
+            last_seen_at: datetime,
+        ) -> Item:
+            if item.title == "bad":
+                raise ValueError("bad item")
+            return build_result_item(item, canonical_url, first_seen_at, last_seen_at)
+
+        monkeypatch.setattr(store, "_build_result_item", fail_on_bad)
+
+        with pytest.raises(ValueError, match="bad item"):
+            store.upsert_items(items)
+
+        assert store.get_item("https://example.com/first") is not None
+        assert store.get_item("https://example.com/bad") is None
+        assert store.get_item("https://example.com/after") is None
+        assert store.get_stats()["items"] == 1
+
     def test_url_canonicalization_on_upsert(self, store: StateStore) -> None:
         """Test URLs are canonicalized on upsert."""
         item = Item(
@@ -140,6 +140,15 @@ class TestBaseCollectorRawJsonTruncation:
         assert "raw_truncated" in json_str
         assert len(json_str.encode("utf-8")) <= RAW_JSON_MAX_SIZE
 
+    def test_multibyte_json_measured_in_bytes(self) -> None:
+        """Size limit counts UTF-8 bytes, not characters."""
+        collector = ConcreteCollector()
+        # Fewer characters than the limit, but more bytes once encoded
+        data = {"content": "é" * (RAW_JSON_MAX_SIZE // 2)}
+        json_str, truncated = collector.truncate_raw_json(data)
+        assert truncated is True
+        assert len(json_str.encode("utf-8")) <= RAW_JSON_MAX_SIZE
+
     def test_sanitizes_sensitive_keys(self) -> None:
         """Sensitive keys are removed from raw_json."""
         collector = ConcreteCollector()
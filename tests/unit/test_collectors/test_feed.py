@@ -0,0 +1,49 @@
+"""Unit tests for shared feed parsing."""
+
+from src.collectors.feed import parse_feed
+
+
+LATIN1_DECLARED_UTF8_BODY = (
+    b'<?xml version="1.0" encoding="iso-8859-1"?>'
+    b'<rss version="2.0"><channel><item>'
+    b"<title>caf\xc3\xa9</title><link>https://example.com/a</link>"
+    b"</item></channel></rss>"
+)
+
+
+class TestParseFeed:
+    """Tests for parse_feed."""
+
+    def test_declared_charset_overrides_xml_declaration(self) -> None:
+        """Charset from the response headers is used to decode the body."""
+        feed = parse_feed(
+            LATIN1_DECLARED_UTF8_BODY,
+            {"content-type": "application/rss+xml; charset=utf-8"},
+        )
+        assert feed.entries[0].title == "café"
+
+    def test_non_xml_content_type_with_charset(self) -> None:
+        """Feeds served as text/html still parse cleanly with the charset."""
+        feed = parse_feed(
+            LATIN1_DECLARED_UTF8_BODY,
+            {"content-type": 'text/html; charset="utf-8"'},
+        )
+        assert not feed.bozo
+        assert feed.entries[0].title == "café"
+
+    def test_content_type_without_charset_is_not_forwarded(self) -> None:
+        """A non-XML media type without a charset is not flagged."""
+        feed = parse_feed(LATIN1_DECLARED_UTF8_BODY, {"content-type": "text/plain"})
+        assert not feed.bozo
+        assert feed.entries[0].title == "café"
+
+    def test_malformed_feed_recovers_entries(self) -> None:
+        """Unescaped ampersands are reported as bozo but entries survive."""
+        body = (
+            b'<?xml version="1.0"?><rss version="2.0"><channel><item>'
+            b"<title>A & B</title><link>https://example.com/a</link>"
+            b"</item></channel></rss>"
+        )
+        feed = parse_feed(body, {})
+        assert feed.bozo
+        assert feed.entries[0].title == "A & B"
@@ -19,6 +19,7 @@ def make_source_config(
     source_id: str = "test-source",
     url: str = "https://example.com/feed.xml",
     max_items: int = 0,
+    sanitize: bool = True,
 ) -> SourceConfig:
     """Create a test SourceConfig."""
     return SourceConfig(
@@ -29,6 +30,7 @@ def make_source_config(
         kind=SourceKind.BLOG,
         tier=SourceTier.TIER_1,
         max_items=max_items,
+        sanitize=sanitize,
     )
 
 
@@ -451,6 +453,41 @@ class TestRssAtomCollectorEntryParsing:
         raw_data = json.loads(result.items[0].raw_json)
         assert "categories" in raw_data
 
+    def test_summary_sanitization_follows_source_flag(self) -> None:
+        """Summary HTML is sanitized unless the source opts out."""
+        collector = RssAtomCollector()
+        http_client = MagicMock()
+
+        feed = b"""<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <item>
+                    <title>Scripted Article</title>
+                    <link>https://example.com/scripted</link>
+                    <description>&lt;p&gt;Body&lt;/p&gt;&lt;script&gt;x()&lt;/script&gt;</description>
+                    <pubDate>Wed, 03 Jan 2024 08:00:00 GMT</pubDate>
+                </item>
+            </channel>
+        </rss>"""
+
+        http_client.fetch.return_value = make_fetch_result(body=feed)
+
+        sanitized = collector.collect(
+            source_config=make_source_config(),
+            http_client=http_client,
+            now=TEST_TIMESTAMP,
+        )
+        trusted = collector.collect(
+            source_config=make_source_config(sanitize=False),
+            http_client=http_client,
+            now=TEST_TIMESTAMP,
+        )
+
+        import json
+
+        assert "<script>" not in json.loads(sanitized.items[0].raw_json)["summary"]
+        assert "<script>" in json.loads(trusted.items[0].raw_json)["summary"]
+
     def test_entry_with_author(self) -> None:
         """Entry with author parses it correctly."""
         collector = RssAtomCollector()
@@ -513,7 +550,7 @@ class TestRssAtomCollectorDateExtraction:
         )
 
         assert len(result.items) == 1
-        assert result.items[0].published_at is not None
+        assert result.items[0].published_at == datetime(2024, 1, 3, 8, tzinfo=UTC)
         assert result.items[0].date_confidence.value == "high"
 
     def test_updated_parsed_date(self) -> None:
@@ -646,3 +683,40 @@ class TestRssAtomCollectorExceptionHandling:
 
         assert result.state == SourceState.SOURCE_DONE
         assert len(result.items) == 1
+
+
+class TestFeedParserAliases:
+    """Tests for fields feedparser exposes under normalized names."""
+
+    def test_rss_description_stored_as_summary(self) -> None:
+        """RSS description is read through the summary alias."""
+        import json
+
+        collector = RssAtomCollector()
+        source_config = make_source_config()
+        http_client = MagicMock()
+
+        feed = b"""<?xml version="1.0"?>
+        <rss version="2.0">
+            <channel>
+                <title>Test Feed</title>
+                <item>
+                    <title>Article</title>
+                    <link>https://example.com/article</link>
+                    <pubDate>Wed, 03 Jan 2024 08:00:00 GMT</pubDate>
+                    <description>From description</description>
+                </item>
+            </channel>
+        </rss>"""
+
+        http_client.fetch.return_value = make_fetch_result(body=feed)
+
+        result = collector.collect(
+            source_config=source_config,
+            http_client=http_client,
+            now=TEST_TIMESTAMP,
+        )
+
+        assert result.state == SourceState.SOURCE_DONE
+        raw_data = json.loads(result.items[0].raw_json)
+        assert raw_data["summary"] == "From description"
@@ -1,6 +1,7 @@
 """Unit tests for collector state machine."""
 
 import pytest
+import structlog.testing
 
 from src.collectors.state_machine import (
     SourceState,
@@ -157,3 +158,39 @@ class TestSourceStateMachine:
             sm.to_parsing()
         assert exc_info.value.source_id == "my-source-123"
         assert "my-source-123" in str(exc_info.value)
+
+
+class TestSourceStateMachineLogging:
+    """Tests for state machine log events."""
+
+    def test_transition_log_carries_run_and_source_id(self) -> None:
+        """Transition events identify the run and source without a bound logger."""
+        sm = SourceStateMachine(source_id="test-source", run_id="test-run")
+
+        with structlog.testing.capture_logs() as logs:
+            sm.to_fetching()
+
+        assert logs == [
+            {
+                "event": "state_transition",
+                "log_level": "info",
+                "component": "collector",
+                "run_id": "test-run",
+                "source_id": "test-source",
+                "from_state": "SOURCE_PENDING",
+                "to_state": "SOURCE_FETCHING",
+            }
+        ]
+
+    def test_illegal_transition_log_carries_run_id(self) -> None:
+        """Illegal transition events carry the run ID outside any bound context."""
+        sm = SourceStateMachine(source_id="test-source", run_id="test-run")
+
+        with (
+            structlog.testing.capture_logs() as logs,
+            pytest.raises(SourceStateTransitionError),
+        ):
+            sm.to_parsing()
+
+        assert logs[0]["event"] == "illegal_state_transition"
+        assert logs[0]["run_id"] == "test-run"
@@ -1,8 +1,11 @@
 """Unit tests for configuration constants."""
 
+import hashlib
+
 import pytest
 
 from src.features.config.constants import (
+    CHECKSUM_ALGO,
     COMPONENT_CLI,
     COMPONENT_CONFIG,
     COMPONENT_EVIDENCE,
@@ -109,3 +112,12 @@ class TestFileTypeConstants:
         """Test that file types are unique."""
         types = [FILE_TYPE_SOURCES, FILE_TYPE_ENTITIES, FILE_TYPE_TOPICS]
         assert len(types) == len(set(types))
+
+
+class TestChecksumConstants:
+    """Tests for checksum constants."""
+
+    @pytest.mark.unit
+    def test_checksum_algo_is_available(self) -> None:
+        """Test that the checksum algorithm is supported by hashlib."""
+        assert CHECKSUM_ALGO in hashlib.algorithms_available
@@ -127,6 +127,21 @@ class TestFixtureLoader:
         assert manifest.fixtures["test_feed"].content == content
         assert manifest.fixtures["test_feed"].source_type == "rss_atom"
 
+    def test_load_skips_hidden_files_and_subdirectories(self, tmp_path: Path) -> None:
+        """Only visible regular files are loaded, in name order."""
+        rss_dir = tmp_path / "rss_atom"
+        rss_dir.mkdir()
+        (rss_dir / "b_feed.xml").write_bytes(b"<rss>b</rss>")
+        (rss_dir / "a_feed.xml").write_bytes(b"<rss>a</rss>")
+        (rss_dir / ".hidden.xml").write_bytes(b"<rss>hidden</rss>")
+        (rss_dir / "nested").mkdir()
+
+        loader = FixtureLoader(fixtures_dir=tmp_path, run_id="test-run")
+        manifest = loader.load_all()
+
+        assert list(manifest.fixtures) == ["a_feed", "b_feed"]
+        assert manifest.fixtures["a_feed"].path == str(Path("rss_atom", "a_feed.xml"))
+
     def test_checksum_computation(self, tmp_path: Path) -> None:
         """Checksums are computed correctly."""
         rss_dir = tmp_path / "rss_atom"
@@ -306,6 +306,21 @@ class TestBaseValidator:
 
         assert actual == expected
 
+    def test_base_validator_compute_file_checksum_multi_chunk(
+        self, tmp_path: Path
+    ) -> None:
+        """compute_file_checksum matches a one-shot hash across read chunks."""
+        from src.e2e.validators import BaseValidator
+
+        content = bytes(range(256)) * 4097
+        test_file = tmp_path / "large.bin"
+        test_file.write_bytes(content)
+
+        expected = hashlib.sha256(content).hexdigest()
+        actual = BaseValidator.compute_file_checksum(test_file)
+
+        assert actual == expected
+
     def test_validators_inherit_from_base(self) -> None:
         """All validators inherit from BaseValidator."""
         from src.e2e.validators import (
@@ -1,11 +1,16 @@
 """Unit tests for mock HTTP transport."""
 
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
 from src.e2e.fixtures import FixtureLoader
-from src.e2e.mock_transport import MockHttpClient, NetworkAccessBlockedError
+from src.e2e.mock_transport import (
+    MockHttpClient,
+    NetworkAccessBlockedError,
+    RequestRecord,
+)
 
 
 class TestMockHttpClient:
@@ -139,6 +144,16 @@ class TestMockHttpClient:
         assert "html" in html_result.headers["content-type"]
 
 
+class TestRequestRecord:
+    """Tests for RequestRecord."""
+
+    def test_record_has_no_instance_dict(self) -> None:
+        """Records use slots, so they do not carry a per-instance __dict__."""
+        record = RequestRecord(url="https://example.com", timestamp=datetime.now(UTC))
+
+        assert not hasattr(record, "__dict__")
+
+
 class TestNetworkAccessBlockedError:
     """Tests for NetworkAccessBlockedError."""
 
@@ -132,6 +132,15 @@ class TestE2EStateMachine:
         sm.transition(E2EState.RUN_PIPELINE)
         assert sm.get_expected_next_state() == E2EState.VALIDATE_DB
 
+    def test_expected_next_states_walk_to_done(self) -> None:
+        """Following get_expected_next_state reaches DONE via valid steps."""
+        sm = E2EStateMachine("test-run")
+
+        while (next_state := sm.get_expected_next_state()) is not None:
+            sm.transition(next_state)
+
+        assert sm.is_done()
+
     def test_terminal_state_has_no_next(self) -> None:
         """Terminal states return None for next state."""
         sm = E2EStateMachine("test-run")
@@ -40,6 +40,31 @@ class TestDatabaseValidator:
         assert "runs" in result.table_row_counts
         assert "items" in result.table_row_counts
 
+    def test_validate_counts_rows_per_table(self, tmp_path: Path) -> None:
+        """Row counts are reported for every table, including empty ones."""
+        db_path = tmp_path / "test.db"
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE schema_version (version INTEGER)")
+        conn.execute("INSERT INTO schema_version VALUES (1)")
+        conn.execute("CREATE TABLE runs (id INTEGER)")
+        conn.executemany("INSERT INTO runs VALUES (?)", [(1,), (2,)])
+        conn.execute("CREATE TABLE items (id INTEGER)")
+        conn.executemany("INSERT INTO items VALUES (?)", [(1,), (2,), (3,)])
+        conn.execute("CREATE TABLE http_cache (id INTEGER)")
+        conn.commit()
+        conn.close()
+
+        validator = DatabaseValidator("test-run")
+        result = validator.validate(db_path)
+
+        assert result.table_row_counts == {
+            "schema_version": 1,
+            "runs": 2,
+            "items": 3,
+            "http_cache": 0,
+        }
+
     def test_validate_wrong_schema_version(self, tmp_path: Path) -> None:
         """Validation fails for wrong schema version."""
         db_path = tmp_path / "test.db"
@@ -1,5 +1,6 @@
 """Unit tests for EffectiveConfig."""
 
+import hashlib
 import json
 
 import pytest
@@ -141,6 +142,17 @@ class TestEffectiveConfig:
         assert "run_id" in data
         assert data["run_id"] == "test-run-123"
 
+    @pytest.mark.unit
+    def test_to_normalized_dict_matches_json(
+        self, effective_config: EffectiveConfig
+    ) -> None:
+        """Test to_normalized_dict mirrors the normalized JSON, keys sorted."""
+        data = effective_config.to_normalized_dict()
+        assert data == json.loads(effective_config.to_normalized_json())
+        assert json.dumps(data, separators=(",", ":")) == (
+            effective_config.to_normalized_json()
+        )
+
     @pytest.mark.unit
     def test_compute_checksum_stable(self, effective_config: EffectiveConfig) -> None:
         """Test that checksum is stable across calls."""
@@ -148,6 +160,54 @@ class TestEffectiveConfig:
         checksum2 = effective_config.compute_checksum()
         assert checksum1 == checksum2
         assert len(checksum1) == 64  # SHA-256 hex length
+        expected = hashlib.sha256(
+            effective_config.to_normalized_json().encode("utf-8")
+        ).hexdigest()
+        assert checksum1 == expected
+
+    @pytest.mark.unit
+    def test_normalized_json_and_checksum_cached(
+        self, effective_config: EffectiveConfig
+    ) -> None:
+        """Test that serialization runs once per instance."""
+        checksum = effective_config.compute_checksum()
+        assert effective_config.to_normalized_json() is (
+            effective_config.to_normalized_json()
+        )
+        assert effective_config.compute_checksum() is checksum
+        assert effective_config.summary()["config_checksum"] == checksum
+
+    @pytest.mark.unit
+    def test_hash_matches_equal_config(
+        self,
+        effective_config: EffectiveConfig,
+    ) -> None:
+        """Test that equal configs hash equal."""
+        copy = EffectiveConfig.model_validate(effective_config.model_dump())
+        assert hash(copy) == hash(effective_config)
+        assert len({copy, effective_config}) == 1
+
+    @pytest.mark.unit
+    def test_model_copy_drops_cached_values(
+        self,
+        effective_config: EffectiveConfig,
+    ) -> None:
+        """Test that an updated copy does not reuse the original's caches."""
+        original_checksum = effective_config.compute_checksum()
+        original_hash = hash(effective_config)
+        assert effective_config.get_source_by_id("source-1") is not None
+
+        sources = effective_config.sources.model_copy(
+            update={"sources": effective_config.sources.sources[1:]}
+        )
+        copied = effective_config.model_copy(update={"sources": sources})
+        rebuilt = EffectiveConfig.model_validate(copied.model_dump())
+
+        assert copied.get_source_by_id("source-1") is None
+        assert copied.get_enabled_sources() == []
+        assert copied.compute_checksum() == rebuilt.compute_checksum()
+        assert copied.compute_checksum() != original_checksum
+        assert hash(copied) == hash(rebuilt) != original_hash
 
     @pytest.mark.unit
     def test_compute_checksum_different_for_different_configs(
@@ -190,6 +250,84 @@ class TestEffectiveConfig:
         assert intl_entities[0].id == "entity-1"
         assert cn_entities[0].id == "entity-2"
 
+    @pytest.mark.unit
+    def test_filtered_lists_are_independent_copies(
+        self, effective_config: EffectiveConfig
+    ) -> None:
+        """Test that callers mutating returned lists do not affect the config."""
+        effective_config.get_enabled_sources().clear()
+        effective_config.get_entities_by_region("cn").clear()
+        assert len(effective_config.get_enabled_sources()) == 1
+        assert len(effective_config.get_entities_by_region("cn")) == 1
+        assert effective_config.get_entities_by_region("unknown") == []
+
+    @pytest.mark.unit
+    def test_get_entities_by_region_accepts_enum(
+        self, effective_config: EffectiveConfig
+    ) -> None:
+        """Test that region lookups accept EntityRegion members as well."""
+        assert effective_config.get_entities_by_region(EntityRegion.CN) == (
+            effective_config.get_entities_by_region("cn")
+        )
+
+    @pytest.mark.unit
+    def test_get_source_by_id(self, effective_config: EffectiveConfig) -> None:
+        """Test get_source_by_id finds sources and returns None when missing."""
+        source = effective_config.get_source_by_id("source-1")
+        assert source is not None
+        assert source.id == "source-1"
+        assert effective_config.get_source_by_id("missing") is None
+
+    @pytest.mark.unit
+    def test_get_entity_by_id(self, effective_config: EffectiveConfig) -> None:
+        """Test get_entity_by_id finds entities and returns None when missing."""
+        entity = effective_config.get_entity_by_id("entity-2")
+        assert entity is not None
+        assert entity.id == "entity-2"
+        assert effective_config.get_entity_by_id("missing") is None
+
+    @pytest.mark.unit
+    def test_id_lookup_does_not_affect_serialization(
+        self, effective_config: EffectiveConfig
+    ) -> None:
+        """Test that lookups leave the normalized JSON and equality unchanged."""
+        before = effective_config.to_normalized_json()
+        effective_config.get_source_by_id("source-1")
+        effective_config.get_entity_by_id("entity-1")
+        assert effective_config.to_normalized_json() == before
+        assert effective_config == effective_config.model_copy(deep=True)
+
+    def test_default_sanitize_left_out_of_normalized_json(
+        self, effective_config: EffectiveConfig
+    ) -> None:
+        """Test that only a non-default sanitize flag reaches the checksum input."""
+        normalized = json.loads(effective_config.to_normalized_json())
+        assert all(
+            "sanitize" not in source for source in normalized["sources"]["sources"]
+        )
+
+        trusted_source = effective_config.sources.sources[0].model_copy(
+            update={"sanitize": False}
+        )
+        trusted = effective_config.model_copy(
+            update={
+                "sources": effective_config.sources.model_copy(
+                    update={
+                        "sources": [
+                            trusted_source,
+                            *effective_config.sources.sources[1:],
+                        ]
+                    }
+                )
+            }
+        )
+        trusted_normalized = json.loads(trusted.to_normalized_json())
+        assert trusted_normalized["sources"]["sources"][0]["sanitize"] is False
+        assert trusted.compute_checksum() != effective_config.compute_checksum()
+        assert SourceConfig.model_validate(trusted_source.model_dump()) == (
+            trusted_source
+        )
+
     @pytest.mark.unit
     def test_summary(self, effective_config: EffectiveConfig) -> None:
         """Test summary returns correct information."""
@@ -202,6 +340,22 @@ class TestEffectiveConfig:
         assert "config_checksum" in summary
         assert len(summary["file_checksums"]) == 3  # type: ignore[arg-type]
 
+    @pytest.mark.unit
+    def test_summary_file_checksums_is_a_copy(
+        self, effective_config: EffectiveConfig
+    ) -> None:
+        """Test that mutating the summary cannot alter the config or checksum."""
+        checksum = effective_config.compute_checksum()
+        summary = effective_config.summary()
+        summary["file_checksums"]["/path/extra.yaml"] = "zzz"  # type: ignore[index]
+        assert "/path/extra.yaml" not in effective_config.file_checksums
+        assert (
+            EffectiveConfig.model_validate(
+                effective_config.model_dump()
+            ).compute_checksum()
+            == checksum
+        )
+
 
 class TestEffectiveConfigIdempotency:
     """Tests for EffectiveConfig idempotency requirements."""
@@ -234,3 +388,34 @@ class TestEffectiveConfigIdempotency:
 
         # Identical checksums
         assert config1.compute_checksum() == config2.compute_checksum()
+
+    @pytest.mark.unit
+    def test_normalized_json_canonical_format(
+        self,
+        sample_sources: SourcesConfig,
+        sample_topics: TopicsConfig,
+    ) -> None:
+        """Test that normalized JSON is compact and ASCII-escaped."""
+        entities = EntitiesConfig(
+            entities=[
+                EntityConfig(
+                    id="qwen",
+                    name="通义千问",
+                    region=EntityRegion.CN,
+                    keywords=["qwen"],
+                    prefer_links=[LinkType.GITHUB],
+                ),
+            ],
+        )
+        config = EffectiveConfig(
+            sources=sample_sources,
+            entities=entities,
+            topics=sample_topics,
+            run_id="test-run",
+        )
+
+        json_str = config.to_normalized_json()
+        assert json_str.isascii()
+        assert '"name":"\\u901a\\u4e49\\u5343\\u95ee"' in json_str
+        assert ", " not in json_str
+        assert json.loads(json_str)["entities"]["entities"][0]["name"] == "通义千问"
@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -49,6 +50,15 @@ class TestArtifactManifest:
         assert manifest.total_bytes == 0
         assert manifest.artifacts == []
 
+    def test_manifest_slots(self) -> None:
+        """Should not carry a per-instance __dict__."""
+        manifest = ArtifactManifest(
+            run_id="test-run",
+            git_commit="abc123",
+            generated_at="2024-01-01T00:00:00Z",
+        )
+        assert not hasattr(manifest, "__dict__")
+
     def test_add_artifact(self) -> None:
         """add_artifact should add artifact and update total bytes."""
         manifest = ArtifactManifest(
@@ -222,6 +232,39 @@ class TestEvidenceCapture:
         assert "Sources Count**: 5" in content
         assert "Config Checksum**: checksum123" in content
 
+    def test_write_state_md_computes_summary_once(
+        self, temp_base_path: Path, mock_config: MagicMock
+    ) -> None:
+        """write_state_md should reuse its config summary for the snapshot."""
+        capture = EvidenceCapture(
+            feature_key="test-feature",
+            run_id="test-run",
+            base_path=temp_base_path,
+        )
+        capture.write_state_md(config=mock_config)
+
+        mock_config.summary.assert_called_once_with()
+        snapshots_dir = temp_base_path / "features" / "test-feature" / "snapshots"
+        (snapshot_path,) = snapshots_dir.glob("config_snapshot_*.json")
+        snapshot = json.loads(snapshot_path.read_text())
+        assert snapshot["summary"] == mock_config.summary.return_value
+
+    def test_snapshot_timestamp_matches_state_md(
+        self, temp_base_path: Path, mock_config: MagicMock
+    ) -> None:
+        """The snapshot should carry the same timestamp as its STATE.md update."""
+        capture = EvidenceCapture(
+            feature_key="test-feature",
+            run_id="test-run",
+            base_path=temp_base_path,
+        )
+        state_path = capture.write_state_md(config=mock_config)
+
+        snapshots_dir = temp_base_path / "features" / "test-feature" / "snapshots"
+        (snapshot_path,) = snapshots_dir.glob("config_snapshot_*.json")
+        snapshot = json.loads(snapshot_path.read_text())
+        assert f"**Last Updated**: {snapshot['timestamp']}\n" in state_path.read_text()
+
     def test_write_state_md_includes_db_stats(
         self, temp_base_path: Path, mock_config: MagicMock
     ) -> None:
@@ -237,6 +280,31 @@ class TestEvidenceCapture:
         assert "Database Statistics" in content
         assert "| items | 100 |" in content
 
+    def test_prune_snapshots_keeps_latest(self, temp_base_path: Path) -> None:
+        """_prune_snapshots should delete the snapshots with the oldest names."""
+        capture = EvidenceCapture(
+            feature_key="test-feature",
+            run_id="test-run",
+            base_path=temp_base_path,
+        )
+        capture.ensure_directories()
+        snapshots_dir = temp_base_path / "features" / "test-feature" / "snapshots"
+        for day in range(1, 6):
+            snapshot = snapshots_dir / f"config_snapshot_2026010{day}_000000.json"
+            snapshot.write_text("{}")
+            # Modification times run opposite to the timestamps in the names
+            os.utime(snapshot, ns=(-day * 10**9 + 10**10, -day * 10**9 + 10**10))
+        (snapshots_dir / "notes.txt").write_text("keep me")
+
+        capture._prune_snapshots(keep=3)
+
+        assert sorted(p.name for p in snapshots_dir.iterdir()) == [
+            "config_snapshot_20260103_000000.json",
+            "config_snapshot_20260104_000000.json",
+            "config_snapshot_20260105_000000.json",
+            "notes.txt",
+        ]
+
     def test_write_e2e_report_creates_file(self, temp_base_path: Path) -> None:
         """write_e2e_report should create E2E_RUN_REPORT.md file."""
         capture = EvidenceCapture(
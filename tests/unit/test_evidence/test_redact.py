@@ -175,6 +175,12 @@ class TestContainsSecrets:
         content = "Normal log message: run completed successfully"
         assert contains_secrets(content) is False
 
+    def test_detects_secret_matched_only_by_late_pattern(self) -> None:
+        """Should check every pattern, not just the first few."""
+        content = "aws: wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY"
+        assert [m.pattern_name for m in scan_for_secrets(content)] == ["aws_secret_key"]
+        assert contains_secrets(content) is True
+
 
 class TestGetSecretPatterns:
     """Tests for get_secret_patterns function."""
@@ -103,6 +103,18 @@ class TestEvidenceWriter:
         expected = "6ae8a75555209fd6c44157c0aed8016e763ff435a19cf186f76863140143ff72"
         assert checksum == expected
 
+    def test_compute_file_checksum_multi_chunk(
+        self, writer: EvidenceWriter, tmp_path: Path
+    ) -> None:
+        """Test that file checksums match in-memory checksums across read chunks."""
+        content = bytes(range(256)) * 4097
+        test_file = tmp_path / "large.bin"
+        test_file.write_bytes(content)
+
+        checksum = writer.compute_file_checksum(test_file)
+
+        assert checksum == EvidenceWriter.compute_checksum(content)
+
     def test_write_safely_basic(self, writer: EvidenceWriter, tmp_path: Path) -> None:
         """Test basic safe file writing."""
         test_file = tmp_path / "test.md"
@@ -199,6 +211,17 @@ class TestEvidenceWriter:
         assert test_file.read_text(encoding="utf-8") == content
         assert artifact.bytes_written == len(content.encode("utf-8"))
 
+    def test_write_safely_file_matches_checksum(
+        self, writer: EvidenceWriter, tmp_path: Path
+    ) -> None:
+        """Test that the bytes on disk are exactly the bytes that were hashed."""
+        test_file = tmp_path / "test.md"
+
+        artifact = writer.write_safely(test_file, "line one\nline two ✓\n", "md")
+
+        assert writer.compute_file_checksum(test_file) == artifact.checksum
+        assert test_file.stat().st_size == artifact.bytes_written
+
     def test_write_safely_creates_artifact_info(
         self, writer: EvidenceWriter, tmp_path: Path
     ) -> None:
@@ -125,6 +125,63 @@ class TestSourceConfig:
         errors = exc_info.value.errors()
         assert any("must not be stored in config" in str(e["msg"]) for e in errors)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("header", ["COOKIE", "X-Api-Key"])
+    def test_source_config_forbidden_header_case_insensitive(self, header: str) -> None:
+        """Test that forbidden headers are rejected regardless of case."""
+        with pytest.raises(ValidationError, match="must not be stored in config"):
+            SourceConfig(
+                id="test",
+                name="Test",
+                url="https://example.com/feed",
+                tier=SourceTier.TIER_0,
+                method=SourceMethod.RSS_ATOM,
+                kind=SourceKind.BLOG,
+                headers={"Accept": "application/xml", header: "secret"},
+            )
+
+
+class TestSourceConfigHashing:
+    """Tests for content-based hashing of config models."""
+
+    @staticmethod
+    def _make(source_id: str, headers: dict[str, str]) -> SourceConfig:
+        return SourceConfig(
+            id=source_id,
+            name="Test",
+            url="https://example.com/feed",
+            tier=SourceTier.TIER_0,
+            method=SourceMethod.RSS_ATOM,
+            kind=SourceKind.BLOG,
+            headers=headers,
+        )
+
+    @pytest.mark.unit
+    def test_equal_configs_hash_equal(self) -> None:
+        """Test that equal configs with dict fields hash equal and dedupe."""
+        first = self._make("test", {"Accept": "a", "User-Agent": "b"})
+        second = self._make("test", {"User-Agent": "b", "Accept": "a"})
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+    @pytest.mark.unit
+    def test_model_copy_drops_cached_hash(self) -> None:
+        """Test that an updated copy hashes by its own content."""
+        original = self._make("test", {})
+        hash(original)
+        copied = original.model_copy(update={"id": "other"})
+        assert hash(copied) == hash(self._make("other", {}))
+
+    @pytest.mark.unit
+    def test_equal_values_of_different_types_hash_equal(self) -> None:
+        """Test that defaults equal across bool and int keep equal hashes."""
+        flag = SourcesConfig(defaults={"enabled": True}, sources=[])
+        number = SourcesConfig(defaults={"enabled": 1}, sources=[])
+        assert flag == number
+        assert hash(flag) == hash(number)
+        assert len({flag, number}) == 1
+
 
 class TestSourcesConfig:
     """Tests for SourcesConfig (root) schema."""
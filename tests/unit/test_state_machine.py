@@ -29,6 +29,14 @@ class TestConfigStateMachine:
         machine = ConfigStateMachine()
         assert machine.state == ConfigState.UNLOADED
 
+    @pytest.mark.unit
+    def test_slotted_instance(self) -> None:
+        """Test that instances carry no per-instance __dict__."""
+        machine = ConfigStateMachine()
+        assert not hasattr(machine, "__dict__")
+        with pytest.raises(AttributeError):
+            machine.extra = True  # type: ignore[attr-defined]
+
     @pytest.mark.unit
     def test_valid_transition_unloaded_to_loading(self) -> None:
         """Test valid transition from UNLOADED to LOADING."""